@@ -1,10 +1,47 @@
+import asyncio
 import numpy as np
-import time
 import threading
+import time
+from functools import lru_cache
 from typing import Dict, List
-from ..binance_client import BinanceFuturesClient
+from ..binance_client import BinanceFuturesClient, ORDER_BUCKET
+from ..binance_client_async import AsyncBinanceFuturesClient, get_background_loop
 from ..logger import TradingLogger
-from ..limit_orders import LimitOrder
+
+
+# Per-level order states, stored as int8 codes in grid['level_status']
+LEVEL_STATUSES = ('PENDING', 'PLACED', 'OPEN', 'FILLED', 'FAILED', 'ERROR', 'CANCELED')
+PENDING, PLACED, OPEN, FILLED, FAILED, ERROR, CANCELED = range(len(LEVEL_STATUSES))
+
+# Values of grid['sides']: 0 = BUY, 1 = SELL
+SIDES = ('BUY', 'SELL')
+
+# ORDER_TRADE_UPDATE order statuses mapped to level states
+ORDER_STATUS_CODES = {
+    'NEW': OPEN,
+    'PARTIALLY_FILLED': OPEN,
+    'FILLED': FILLED,
+    'CANCELED': CANCELED,
+    'EXPIRED': CANCELED
+}
+
+
+@lru_cache(maxsize=64)
+def grid_prices(lower_price: float, upper_price: float, grid_lines: int,
+                grid_type: str = 'Arithmetic') -> np.ndarray:
+    """
+    Unsnapped price ladder for a grid, cached per parameter set
+    
+    The returned array is read-only since it is shared between callers;
+    copy it before modifying.
+    """
+    if grid_type.lower() == 'geometric':
+        prices = np.geomspace(lower_price, upper_price, grid_lines)
+    else:  # Arithmetic
+        prices = np.linspace(lower_price, upper_price, grid_lines)
+    
+    prices.flags.writeable = False
+    return prices
 
 
 class GridStrategy:
@@ -12,9 +49,13 @@ class GridStrategy:
     
     def __init__(self, client: BinanceFuturesClient):
         self.client = client
+        self.async_client = AsyncBinanceFuturesClient.from_client(client)
         self.logger = TradingLogger()
-        self.limit_order = LimitOrder(client)
         self.active_grids = {}
+        
+        # order_id -> (grid, level index), used to route user stream events
+        self._order_index = {}
+        self._subscribed = False
     
     def setup_grid(self, symbol: str, lower_price: float, upper_price: float,
                   grid_lines: int, order_qty: float, grid_type: str = 'Arithmetic') -> Dict:
@@ -33,57 +74,61 @@ class GridStrategy:
             Grid setup details
         """
         try:
-            # Calculate grid prices
-            if grid_type.lower() == 'geometric':
-                prices = np.geomspace(lower_price, upper_price, grid_lines)
-            else:  # Arithmetic
-                prices = np.linspace(lower_price, upper_price, grid_lines)
-            
-            grid_levels = []
-            
-            for i, price in enumerate(prices):
-                if i % 2 == 0:
-                    side = 'BUY'
-                    order_type = 'BUY limit'
-                else:
-                    side = 'SELL'
-                    order_type = 'SELL limit'
-                
-                grid_levels.append({
-                    'level': i + 1,
-                    'price': round(price, 2),
-                    'side': side,
-                    'type': order_type,
-                    'quantity': order_qty,
-                    'status': 'PENDING'
-                })
+            # Calculate grid prices; the cached ladder is shared, so snap a copy
+            prices = grid_prices(lower_price, upper_price, grid_lines, grid_type).copy()
+            
+            # Snap to the symbol's tick size in place so large grids allocate no temporaries
+            tick = self.client.get_symbol_filters(symbol)['tick_size']
+            np.divide(prices, float(tick), out=prices)
+            np.rint(prices, out=prices)
+            np.multiply(prices, float(tick), out=prices)
+            np.round(prices, -tick.as_tuple().exponent, out=prices)
+            
+            # Reject an off-step quantity here, not in the background placement
+            quantity = self.client.quantize_qty(symbol, order_qty)
+            
+            # Alternate BUY/SELL as a one-byte index into SIDES (level parity)
+            sides = np.zeros(grid_lines, dtype=np.uint8)
+            sides[1::2] = 1
             
             grid_id = f"grid_{symbol}_{int(time.time())}"
             
-            self.active_grids[grid_id] = {
+            # Levels are kept as parallel arrays (order_id 0 = not placed)
+            grid = {
                 'symbol': symbol,
                 'lower_price': lower_price,
                 'upper_price': upper_price,
                 'grid_lines': grid_lines,
                 'order_qty': order_qty,
+                'quantity': quantity,
                 'grid_type': grid_type,
-                'levels': grid_levels,
+                'prices': prices,
+                'sides': sides,
+                'order_ids': np.zeros(grid_lines, dtype=np.int64),
+                'level_status': np.full(grid_lines, PENDING, dtype=np.int8),
+                'level_errors': {},
                 'status': 'SETUP',
                 'orders_placed': 0,
-                'orders_filled': 0
+                'orders_filled': 0,
+                '_lock': threading.RLock()
             }
+            self.active_grids[grid_id] = grid
+            grid_levels = self._level_records(grid)
+            
+            # Track fills from the user data stream instead of polling
+            if not self._subscribed:
+                self.async_client.subscribe_user_stream(self._on_user_event)
+                self._subscribed = True
             
             self.logger.log("GRID", 
                           f"Grid setup: {symbol} {lower_price}-{upper_price} "
                           f"with {grid_lines} lines")
             
-            # Place initial orders in background
-            thread = threading.Thread(
-                target=self._place_grid_orders,
-                args=(grid_id,)
+            # Place initial orders on the shared background event loop
+            asyncio.run_coroutine_threadsafe(
+                self._place_grid_orders(grid_id),
+                get_background_loop()
             )
-            thread.daemon = True
-            thread.start()
             
             return {
                 'grid_id': grid_id,
@@ -101,44 +146,33 @@ class GridStrategy:
             self.logger.log("ERROR", error_msg)
             return {'error': error_msg, 'status': 'ERROR'}
     
-    def _place_grid_orders(self, grid_id: str):
-        """Place all grid orders"""
+    async def _place_grid_orders(self, grid_id: str):
+        """Place all grid orders, submitting every batch concurrently"""
         try:
             grid = self.active_grids.get(grid_id)
             if not grid:
                 return
             
+            n = len(grid['prices'])
             symbol = grid['symbol']
             
-            for level in grid['levels']:
-                try:
-                    result = self.limit_order.place_order(
-                        symbol=symbol,
-                        side=level['side'],
-                        quantity=level['quantity'],
-                        price=level['price'],
-                        time_in_force='GTC'
-                    )
-                    
-                    if 'orderId' in result:
-                        level['status'] = 'PLACED'
-                        level['order_id'] = result['orderId']
-                        grid['orders_placed'] += 1
-                        
-                        self.logger.log("GRID_ORDER", 
-                                      f"Grid order placed: {level['side']} "
-                                      f"{level['quantity']} @ {level['price']}")
-                    else:
-                        level['status'] = 'FAILED'
-                        level['error'] = result.get('msg', 'Unknown error')
-                
-                except Exception as e:
-                    level['status'] = 'ERROR'
-                    level['error'] = str(e)
-                    self.logger.log("ERROR", f"Grid order error: {str(e)}")
-                
-                # Small delay between orders
-                time.sleep(0.1)
+            # Only price and side differ between levels, so build the
+            # shared fields and price strings once for the whole grid
+            template = {
+                'symbol': symbol.upper(),
+                'type': 'LIMIT',
+                'quantity': grid['quantity'],
+                'timeInForce': 'GTC'
+            }
+            prices = [self.client.quantize_price(symbol, price)
+                      for price in grid['prices'].tolist()]
+            sides = [SIDES[side] for side in grid['sides'].tolist()]
+            
+            # Binance accepts at most 5 orders per batch request
+            await asyncio.gather(*(
+                self._place_level_batch(grid, template, prices, sides, start, min(start + 5, n))
+                for start in range(0, n, 5)
+            ))
             
             grid['status'] = 'ACTIVE'
             self.active_grids[grid_id] = grid
@@ -148,6 +182,74 @@ class GridStrategy:
         except Exception as e:
             self.logger.log("ERROR", f"Error placing grid orders: {str(e)}")
     
+    async def _place_level_batch(self, grid: Dict, template: Dict, prices: List[str],
+                                 sides: List[str], start: int, stop: int):
+        """Place grid levels [start, stop) as one batch"""
+        batch = [{**template, 'side': side, 'price': price}
+                 for price, side in zip(prices[start:stop], sides[start:stop])]
+        
+        try:
+            await ORDER_BUCKET.acquire_async(len(batch))
+            results = await self.async_client.new_batch_orders_async(batch)
+            
+            with grid['_lock']:
+                for i, (order, result) in enumerate(zip(batch, results), start):
+                    if 'orderId' in result:
+                        grid['level_status'][i] = PLACED
+                        grid['order_ids'][i] = result['orderId']
+                        grid['orders_placed'] += 1
+                        self._order_index[result['orderId']] = (grid, i)
+                        
+                        self.logger.log("GRID_ORDER", 
+                                      f"Grid order placed: {order['side']} "
+                                      f"{order['quantity']} @ {order['price']}")
+                    else:
+                        grid['level_status'][i] = FAILED
+                        grid['level_errors'][i] = result.get('msg', result.get('error', 'Unknown error'))
+        
+        except Exception as e:
+            with grid['_lock']:
+                grid['level_status'][start:stop] = ERROR
+                for i in range(start, stop):
+                    grid['level_errors'][i] = str(e)
+            self.logger.log("ERROR", f"Grid batch order error: {str(e)}")
+    
+    def _level_records(self, grid: Dict) -> List[Dict]:
+        """Build the per-level dicts returned to callers from the level arrays"""
+        sides = [SIDES[side] for side in grid['sides'].tolist()]
+        levels = [{
+            'level': i + 1,
+            'price': price,
+            'side': side,
+            'type': f"{side} limit",
+            'quantity': grid['order_qty'],
+            'status': LEVEL_STATUSES[code],
+            'order_id': order_id or None
+        } for i, (price, side, code, order_id) in enumerate(zip(
+            grid['prices'].tolist(), sides,
+            grid['level_status'].tolist(), grid['order_ids'].tolist()
+        ))]
+        
+        for i, error in grid['level_errors'].items():
+            levels[i]['error'] = error
+        
+        return levels
+    
+    def _on_user_event(self, event: Dict):
+        """Apply ORDER_TRADE_UPDATE events to the owning grid level"""
+        if event.get('e') != 'ORDER_TRADE_UPDATE':
+            return
+        
+        order = event.get('o', {})
+        location = self._order_index.get(order.get('i'))
+        code = ORDER_STATUS_CODES.get(order.get('X'))
+        if location is None or code is None:
+            return
+        
+        grid, i = location
+        with grid['_lock']:
+            grid['level_status'][i] = code
+    
     def monitor_grid(self, grid_id: str) -> Dict:
         """Monitor and update grid status"""
         try:
@@ -156,31 +258,40 @@ class GridStrategy:
                 return {'error': 'Grid not found', 'status': 'ERROR'}
             
             symbol = grid['symbol']
+            generation = self.async_client.user_stream_generation
             
-            # Get open orders
-            open_orders = self.client.get_open_orders(symbol)
-            open_order_ids = [str(order['orderId']) for order in open_orders]
-            
-            # Update grid status
-            filled_orders = 0
-            for level in grid['levels']:
-                if 'order_id' in level:
-                    if str(level['order_id']) in open_order_ids:
-                        level['status'] = 'OPEN'
-                    else:
-                        level['status'] = 'FILLED'
-                        filled_orders += 1
+            # Stream events keep levels current once a poll has happened on this
+            # connection; levels still PLACED may have missed their NEW event
+            with grid['_lock']:
+                in_sync = (generation != 0 and
+                           grid.get('stream_generation') == generation and
+                           not np.any(grid['level_status'] == PLACED))
             
-            grid['orders_filled'] = filled_orders
-            self.active_grids[grid_id] = grid
+            if not in_sync:
+                open_orders = self.client.get_open_orders(symbol)
+                open_order_ids = np.fromiter((int(order['orderId']) for order in open_orders),
+                                             dtype=np.int64, count=len(open_orders))
+                
+                # The order placement task may be writing concurrently
+                with grid['_lock']:
+                    active = np.isin(grid['level_status'], (PLACED, OPEN))
+                    is_open = np.isin(grid['order_ids'][active], open_order_ids)
+                    grid['level_status'][active] = np.where(is_open, OPEN, FILLED)
+                    grid['stream_generation'] = generation
+            
+            with grid['_lock']:
+                filled_orders = int(np.count_nonzero(grid['level_status'] == FILLED))
+                grid['orders_filled'] = filled_orders
+                orders_placed = grid['orders_placed']
+                levels = self._level_records(grid)
             
             return {
                 'grid_id': grid_id,
                 'status': grid['status'],
-                'orders_placed': grid['orders_placed'],
+                'orders_placed': orders_placed,
                 'orders_filled': filled_orders,
-                'completion': f"{(filled_orders / grid['orders_placed']) * 100:.1f}%" if grid['orders_placed'] > 0 else "0%",
-                'levels': grid['levels']
+                'completion': f"{(filled_orders / orders_placed) * 100:.1f}%" if orders_placed > 0 else "0%",
+                'levels': levels
             }
             
         except Exception as e:
@@ -189,7 +300,7 @@ class GridStrategy:
             return {'error': error_msg, 'status': 'ERROR'}
     
     def close_grid(self, grid_id: str) -> Dict:
-        """Close grid strategy and cancel all orders"""
+        """Close grid strategy and cancel its open orders"""
         try:
             grid = self.active_grids.get(grid_id)
             if not grid:
@@ -197,21 +308,32 @@ class GridStrategy:
             
             symbol = grid['symbol']
             
-            # Cancel all open orders for this symbol
+            # Cancel this grid's open orders, at most 10 per batch request
             open_orders = self.client.get_open_orders(symbol)
+            with grid['_lock']:
+                order_ids = grid['order_ids']
+                grid_order_ids = set(order_ids[order_ids != 0].tolist())
+            to_cancel = [order['orderId'] for order in open_orders
+                         if order['orderId'] in grid_order_ids]
             cancelled = 0
             
-            for order in open_orders:
-                try:
-                    result = self.client.cancel_order(symbol, order['orderId'])
-                    if 'orderId' in result:
-                        cancelled += 1
-                except:
-                    pass
+            if to_cancel and len(to_cancel) == len(open_orders):
+                # The grid owns every open order, so one request clears them all
+                result = self.client.cancel_all_open_orders(symbol)
+                if result.get('code') == 200:
+                    cancelled = len(to_cancel)
+            else:
+                for start in range(0, len(to_cancel), 10):
+                    results = self.client.cancel_batch_orders(symbol, to_cancel[start:start + 10])
+                    cancelled += sum(1 for result in results if 'orderId' in result)
             
             grid['status'] = 'CLOSED'
             self.active_grids[grid_id] = grid
             
+            # Stop routing stream events for the closed grid's orders
+            for order_id in grid_order_ids:
+                self._order_index.pop(order_id, None)
+            
             self.logger.log("GRID", f"Grid {grid_id} closed, {cancelled} orders cancelled")
             
             return {
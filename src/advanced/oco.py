@@ -1,3 +1,4 @@
+import time
 from ..binance_client import BinanceFuturesClient
 from ..logger import TradingLogger
 from typing import Dict, List, Tuple
@@ -44,10 +45,10 @@ class OCOOrder:
             order_params = {
                 'symbol': symbol.upper(),
                 'side': side.upper(),
-                'quantity': round(quantity, 8),
-                'price': str(round(price, 2)),
-                'stopPrice': str(round(stop_price, 2)),
-                'stopLimitPrice': str(round(stop_limit_price, 2)),
+                'quantity': self.client.quantize_qty(symbol, quantity),
+                'price': self.client.quantize_price(symbol, price),
+                'stopPrice': self.client.quantize_price(symbol, stop_price),
+                'stopLimitPrice': self.client.quantize_price(symbol, stop_limit_price),
                 'stopLimitTimeInForce': 'GTC',
                 'listClientOrderId': f"oco_{int(time.time() * 1000)}",
                 'limitClientOrderId': f"limit_{int(time.time() * 1000)}",
@@ -56,9 +57,9 @@ class OCOOrder:
             
             # Add optional parameters
             if limit_iceberg_qty:
-                order_params['limitIcebergQty'] = str(round(limit_iceberg_qty, 8))
+                order_params['limitIcebergQty'] = self.client.quantize_qty(symbol, limit_iceberg_qty)
             if stop_iceberg_qty:
-                order_params['stopIcebergQty'] = str(round(stop_iceberg_qty, 8))
+                order_params['stopIcebergQty'] = self.client.quantize_qty(symbol, stop_iceberg_qty)
             
             response = self.client.new_oco_order(**order_params)
             
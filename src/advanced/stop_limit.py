@@ -40,9 +40,9 @@ class StopLimitOrder:
                 'symbol': symbol.upper(),
                 'side': side.upper(),
                 'type': 'STOP',
-                'quantity': round(quantity, 8),
-                'price': str(round(limit_price, 2)),
-                'stopPrice': str(round(stop_price, 2)),
+                'quantity': self.client.quantize_qty(symbol, quantity),
+                'price': self.client.quantize_price(symbol, limit_price),
+                'stopPrice': self.client.quantize_price(symbol, stop_price),
                 'timeInForce': 'GTC',
                 'reduceOnly': reduce_only,
                 'workingType': 'MARK_PRICE',  # Use mark price for triggering
@@ -88,8 +88,8 @@ class StopLimitOrder:
                 'symbol': symbol.upper(),
                 'side': side.upper(),
                 'type': 'TRAILING_STOP_MARKET',
-                'quantity': round(quantity, 8),
-                'activationPrice': str(round(activation_price, 2)),
+                'quantity': self.client.quantize_qty(symbol, quantity),
+                'activationPrice': self.client.quantize_price(symbol, activation_price),
                 'callbackRate': str(callback_rate),
                 'reduceOnly': True,
                 'newOrderRespType': 'RESULT'
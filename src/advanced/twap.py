@@ -1,8 +1,9 @@
+import asyncio
 import time
-import threading
 from datetime import datetime, timedelta
 from typing import Dict, List
 from ..binance_client import BinanceFuturesClient
+from ..binance_client_async import AsyncBinanceFuturesClient, get_background_loop
 from ..logger import TradingLogger
 from ..market_orders import MarketOrder
 
@@ -12,9 +13,11 @@ class TWAPStrategy:
     
     def __init__(self, client: BinanceFuturesClient):
         self.client = client
+        self.async_client = AsyncBinanceFuturesClient.from_client(client)
         self.logger = TradingLogger()
-        self.market_order = MarketOrder(client)
+        self.market_order = MarketOrder(self.async_client)
         self.running_strategies = {}
+        self._cancel_events = {}
     
     def execute(self, symbol: str, side: str, total_quantity: float,
                duration_hours: float, chunks: int = 10) -> Dict:
@@ -35,40 +38,45 @@ class TWAPStrategy:
             chunk_qty = total_quantity / chunks
             interval_seconds = (duration_hours * 3600) / chunks
             
+            # Every chunk is the same order, so encode it once; only the timestamp
+            # and signature are added per request. Building it here rejects a
+            # chunk size off the symbol's step before anything is scheduled
+            order_query = self.market_order.order_query(symbol, side, chunk_qty)
+            
             self.logger.log("TWAP", 
                           f"Starting TWAP: {side} {total_quantity} {symbol} "
                           f"over {duration_hours}h in {chunks} chunks")
             
             execution_plan = []
+            start_time = datetime.now()
             
             for i in range(chunks):
-                execution_time = datetime.now() + timedelta(seconds=i * interval_seconds)
+                execution_time = start_time + timedelta(seconds=i * interval_seconds)
                 execution_plan.append({
                     'chunk': i + 1,
                     'quantity': chunk_qty,
-                    'scheduled_time': execution_time.strftime("%Y-%m-%d %H:%M:%S"),
+                    'scheduled_time': f"{execution_time:%Y-%m-%d %H:%M:%S}",
                     'status': 'PENDING'
                 })
             
-            # Start execution in background thread
             strategy_id = f"twap_{symbol}_{int(time.time())}"
             
-            thread = threading.Thread(
-                target=self._execute_twap_background,
-                args=(strategy_id, symbol, side, chunk_qty, chunks, interval_seconds)
-            )
-            thread.daemon = True
-            thread.start()
-            
             self.running_strategies[strategy_id] = {
                 'symbol': symbol,
                 'side': side,
                 'total_quantity': total_quantity,
                 'chunks_completed': 0,
-                'start_time': datetime.now(),
+                'start_time': start_time,
                 'status': 'RUNNING'
             }
             
+            # Start execution on the shared background event loop
+            asyncio.run_coroutine_threadsafe(
+                self._execute_twap_background(strategy_id, symbol, side, chunk_qty,
+                                              chunks, interval_seconds, order_query),
+                get_background_loop()
+            )
+            
             return {
                 'strategy_id': strategy_id,
                 'symbol': symbol,
@@ -86,21 +94,34 @@ class TWAPStrategy:
             self.logger.log("ERROR", error_msg)
             return {'error': error_msg, 'status': 'ERROR'}
     
-    def _execute_twap_background(self, strategy_id: str, symbol: str, side: str,
-                                chunk_qty: float, chunks: int, interval_seconds: float):
-        """Execute TWAP in background thread"""
+    async def _execute_twap_background(self, strategy_id: str, symbol: str, side: str,
+                                      chunk_qty: float, chunks: int, interval_seconds: float,
+                                      order_query: bytes):
+        """Execute TWAP on the background event loop"""
         try:
+            # Schedule against a fixed start so order latency doesn't accumulate as drift
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            cancel_event = self._cancel_events.setdefault(strategy_id, asyncio.Event())
+            
             for i in range(chunks):
-                time.sleep(interval_seconds)
+                delay = max(0.0, start + i * interval_seconds - loop.time())
+                if await self._wait_cancelled(cancel_event, delay):
+                    return
+                
+                # A cancel may land before the event exists, so also check the flag
+                if self.running_strategies.get(strategy_id, {}).get('status') == 'CANCELLED':
+                    return
                 
                 self.logger.log("TWAP_EXEC", 
                               f"Executing chunk {i+1}/{chunks} for {strategy_id}")
                 
                 # Place market order for this chunk
-                result = self.market_order.place_order(
+                result = await self.market_order.place_order_async(
                     symbol=symbol,
                     side=side,
-                    quantity=chunk_qty
+                    quantity=chunk_qty,
+                    query=order_query
                 )
                 
                 if strategy_id in self.running_strategies:
@@ -109,8 +130,8 @@ class TWAPStrategy:
                 self.logger.log("TWAP_RESULT", 
                               f"Chunk {i+1} result: {result.get('status', 'UNKNOWN')}")
             
-            # Mark strategy as completed
-            if strategy_id in self.running_strategies:
+            # Mark strategy as completed unless it was cancelled mid-order
+            if self.running_strategies.get(strategy_id, {}).get('status') == 'RUNNING':
                 self.running_strategies[strategy_id]['status'] = 'COMPLETED'
                 self.running_strategies[strategy_id]['end_time'] = datetime.now()
                 
@@ -121,6 +142,23 @@ class TWAPStrategy:
             if strategy_id in self.running_strategies:
                 self.running_strategies[strategy_id]['status'] = 'ERROR'
                 self.running_strategies[strategy_id]['error'] = str(e)
+        
+        finally:
+            self._cancel_events.pop(strategy_id, None)
+    
+    async def _wait_cancelled(self, cancel_event: asyncio.Event, timeout: float) -> bool:
+        """Wait up to timeout seconds, returning True if cancellation was requested"""
+        try:
+            await asyncio.wait_for(cancel_event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    def _wake_cancelled(self, strategy_id: str):
+        """Wake a sleeping TWAP worker so it exits before its next chunk"""
+        cancel_event = self._cancel_events.get(strategy_id)
+        if cancel_event is not None:
+            cancel_event.set()
     
     def get_strategy_status(self, strategy_id: str) -> Dict:
         """Get status of a running TWAP strategy"""
@@ -132,6 +170,9 @@ class TWAPStrategy:
             if strategy_id in self.running_strategies:
                 self.running_strategies[strategy_id]['status'] = 'CANCELLED'
                 self.running_strategies[strategy_id]['end_time'] = datetime.now()
+                
+                # Let the worker finish any in-flight order rather than interrupting it
+                get_background_loop().call_soon_threadsafe(self._wake_cancelled, strategy_id)
                 self.logger.log("TWAP", f"Strategy {strategy_id} cancelled")
                 return True
             return False
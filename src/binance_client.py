@@ -1,57 +1,195 @@
 import hmac
 import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import orjson
+from decimal import Decimal, ROUND_HALF_UP
 from typing import Dict, Optional, List
 from urllib.parse import urlencode
 import time
+from .throttle import TokenBucket
+
+
+# Paces order placement for the whole process: 50 orders per 10s, shared by
+# every client and order placer since the limit applies per account
+ORDER_BUCKET = TokenBucket(50, rate_per_sec=5)
 
 
 class BinanceFuturesClient:
     """Binance USDT-M Futures API client"""
     
+    # Used when exchange filters for a symbol are unavailable
+    DEFAULT_TICK_SIZE = Decimal('0.01')
+    DEFAULT_STEP_SIZE = Decimal('0.00000001')
+    
+    # Largest difference from a step multiple treated as float noise in quantize_qty
+    QTY_TOLERANCE = Decimal('1e-12')
+    
+    # Seconds before retrying a failed exchangeInfo load
+    EXCHANGE_INFO_RETRY_INTERVAL = 60
+    
+    # Seconds between server time re-syncs
+    TIME_SYNC_INTERVAL = 300
+    
+    # Max number of cached HMAC prefix states for repeated GET polls
+    SIGNATURE_CACHE_SIZE = 256
+    
+    # Seconds before an unanswered request is abandoned
+    REQUEST_TIMEOUT = 10
+    
+    # Exchange order count reported on responses, used to clamp ORDER_BUCKET
+    ORDER_COUNT_HEADER = 'X-MBX-ORDER-COUNT-1M'
+    ORDER_COUNT_LIMIT = 1200
+    
     def __init__(self, api_key: str = None, api_secret: str = None, testnet: bool = False):
         self.api_key = api_key
         self.api_secret = api_secret
         
+        # Key the HMAC once; each signature copies the prepared ipad/opad state
+        self._hmac_template = (
+            hmac.new(api_secret.encode('utf-8'), digestmod=hashlib.sha256)
+            if api_secret else None
+        )
+        
         if testnet:
             self.base_url = "https://testnet.binancefuture.com"
+            self.stream_url = "wss://stream.binancefuture.com"
         else:
             self.base_url = "https://fapi.binance.com"
+            self.stream_url = "wss://fstream.binance.com"
         
         self.session = requests.Session()
         self.session.headers.update({
             'X-MBX-APIKEY': api_key
         })
+        
+        # Keep enough pooled keep-alive connections for concurrent grid/TWAP
+        # threads; only idempotent requests are retried on gateway errors
+        adapter = HTTPAdapter(
+            pool_connections=50,
+            pool_maxsize=50,
+            max_retries=Retry(total=3, backoff_factor=0.1,
+                              status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        
+        # Per-symbol tick/step sizes, filled lazily from exchangeInfo
+        self._symbol_filters = {}
+        # Load state in a dict so clients derived with from_client() share it
+        self._exchange_info_state = {'loaded': False, 'retry_at': 0.0}
+        
+        # Offset between local and server clocks, synced on first signed request;
+        # a dict so clients derived with from_client() share one measurement
+        self._time_sync = {'offset_ms': 0, 'synced_at': None}
+        
+        # HMAC states with a GET query prefix already absorbed, keyed by prefix
+        self._signature_prefixes = {}
+        
+        # One-way mode positions by symbol, kept current by the user data stream
+        self.position_cache = {}
+    
+    def _generate_signature(self, prefix: bytes, suffix: bytes,
+                            cache_prefix: bool = False) -> str:
+        """Generate HMAC SHA256 signature of prefix + suffix"""
+        signer = self._signature_prefixes.get(prefix) if cache_prefix else None
+        
+        if signer is None:
+            signer = self._hmac_template.copy()
+            signer.update(prefix)
+            
+            if cache_prefix:
+                if len(self._signature_prefixes) >= self.SIGNATURE_CACHE_SIZE:
+                    self._signature_prefixes.clear()
+                self._signature_prefixes[prefix] = signer
+        
+        # Never mutate a cached state; only the varying suffix is hashed per call
+        signer = signer.copy()
+        signer.update(suffix)
+        return signer.hexdigest()
+    
+    def _time_sync_due(self) -> bool:
+        """Whether the server time offset has never been measured or is stale"""
+        synced_at = self._time_sync['synced_at']
+        return synced_at is None or time.monotonic() - synced_at > self.TIME_SYNC_INTERVAL
+    
+    def _sync_time(self):
+        """Measure the offset between the local clock and Binance server time"""
+        self._time_sync['synced_at'] = time.monotonic()
+        
+        try:
+            sent_ms = time.time_ns() // 1_000_000
+            server_ms = self._request('GET', '/fapi/v1/time')['serverTime']
+            received_ms = time.time_ns() // 1_000_000
+            self._time_sync['offset_ms'] = server_ms - (sent_ms + received_ms) // 2
+        except Exception as e:
+            print(f"Error syncing server time: {e}")
+    
+    def _timestamp(self) -> int:
+        """Current server time in milliseconds, re-syncing the offset when stale"""
+        if self._time_sync_due():
+            self._sync_time()
+        
+        return time.time_ns() // 1_000_000 + self._time_sync['offset_ms']
+    
+    def encode_query(self, **params) -> bytes:
+        """Pre-encode static request params for reuse across repeated requests"""
+        return urlencode(params).encode('ascii')
     
-    def _generate_signature(self, data: Dict) -> str:
-        """Generate HMAC SHA256 signature"""
-        query_string = urlencode(data)
-        return hmac.new(
-            self.api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+    def _encode_params(self, params: Dict, signed: bool = False,
+                       cache_prefix: bool = False, query: bytes = b'') -> bytes:
+        """Urlencode params once, appending timestamp and signature when signed"""
+        # urlencode escapes everything outside ASCII, so this is the only encode
+        payload = urlencode(params).encode('ascii')
+        
+        # A pre-encoded query from encode_query() leads the variable params
+        if query:
+            payload = query + b'&' + payload if payload else query
+        
+        if signed:
+            # The timestamp goes last so the static prefix's HMAC state can be reused
+            prefix = payload + b'&' if payload else b''
+            timestamp = b'timestamp=%d' % self._timestamp()
+            signature = self._generate_signature(prefix, timestamp, cache_prefix)
+            payload = prefix + timestamp + b'&signature=' + signature.encode('ascii')
+        
+        return payload
     
-    def _request(self, method: str, endpoint: str, signed: bool = False, **kwargs) -> Dict:
+    def _request(self, method: str, endpoint: str, signed: bool = False,
+                 query: bytes = b'', **kwargs) -> Dict:
         """Make HTTP request to Binance API"""
         url = f"{self.base_url}{endpoint}"
         
-        if signed:
-            kwargs['timestamp'] = int(time.time() * 1000)
-            kwargs['signature'] = self._generate_signature(kwargs)
-        
-        if method == 'GET':
-            response = self.session.get(url, params=kwargs)
-        elif method == 'POST':
-            response = self.session.post(url, data=kwargs)
-        elif method == 'DELETE':
-            response = self.session.delete(url, params=kwargs)
+        # Send exactly the bytes that were signed instead of letting
+        # requests encode the params a second time. A fully pre-encoded
+        # query is as static as a GET poll, so its HMAC state is cached too
+        payload = self._encode_params(kwargs, signed, query=query,
+                                      cache_prefix=method == 'GET' or (bool(query) and not kwargs))
+        
+        if method in ('GET', 'DELETE'):
+            response = self.session.request(
+                method, f"{url}?{payload.decode('ascii')}" if payload else url,
+                timeout=self.REQUEST_TIMEOUT
+            )
+        elif method in ('POST', 'PUT'):
+            response = self.session.request(
+                method, url, data=payload,
+                headers={'Content-Type': 'application/x-www-form-urlencoded'},
+                timeout=self.REQUEST_TIMEOUT
+            )
         else:
             raise ValueError(f"Unsupported method: {method}")
         
+        self._update_order_count(response.headers)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
+    
+    def _update_order_count(self, headers):
+        """Feed the exchange's reported order count into the order bucket"""
+        order_count = headers.get(self.ORDER_COUNT_HEADER)
+        if order_count:
+            ORDER_BUCKET.update_from_exchange(int(order_count), self.ORDER_COUNT_LIMIT)
     
     def get_account_info(self) -> Dict:
         """Get account information"""
@@ -61,6 +199,68 @@ class BinanceFuturesClient:
             print(f"Error getting account info: {e}")
             return {}
     
+    def load_exchange_info(self) -> Dict[str, Dict]:
+        """Load and cache price/quantity filters for all symbols"""
+        try:
+            info = self._request('GET', '/fapi/v1/exchangeInfo')
+        except Exception as e:
+            # Fall back to the defaults for now, but try again later
+            self._exchange_info_state['retry_at'] = (time.monotonic() +
+                                                     self.EXCHANGE_INFO_RETRY_INTERVAL)
+            print(f"Error loading exchange info: {e}")
+            return self._symbol_filters
+        
+        for symbol_info in info.get('symbols', []):
+            filters = {f['filterType']: f for f in symbol_info.get('filters', [])}
+            self._symbol_filters[symbol_info['symbol']] = {
+                'tick_size': Decimal(filters.get('PRICE_FILTER', {}).get(
+                    'tickSize', str(self.DEFAULT_TICK_SIZE))),
+                'step_size': Decimal(filters.get('LOT_SIZE', {}).get(
+                    'stepSize', str(self.DEFAULT_STEP_SIZE)))
+            }
+        
+        self._exchange_info_state['loaded'] = True
+        return self._symbol_filters
+    
+    def get_symbol_filters(self, symbol: str) -> Dict:
+        """Get cached tick and step size for a symbol"""
+        symbol = symbol.upper()
+        
+        state = self._exchange_info_state
+        if (symbol not in self._symbol_filters and not state['loaded']
+                and time.monotonic() >= state['retry_at']):
+            self.load_exchange_info()
+        
+        return self._symbol_filters.get(symbol, {
+            'tick_size': self.DEFAULT_TICK_SIZE,
+            'step_size': self.DEFAULT_STEP_SIZE
+        })
+    
+    def quantize_price(self, symbol: str, price: float) -> str:
+        """Round a price to the symbol's tick size"""
+        tick = self.get_symbol_filters(symbol)['tick_size']
+        ticks = (Decimal(str(price)) / tick).to_integral_value(rounding=ROUND_HALF_UP)
+        return format(ticks * tick, 'f')
+    
+    def quantize_qty(self, symbol: str, quantity: float) -> str:
+        """
+        Format a quantity on the symbol's step size
+        
+        Raises:
+            ValueError: If the quantity is not a multiple of the step size;
+                an order is never sent with a different size than requested
+        """
+        step = self.get_symbol_filters(symbol)['step_size']
+        value = Decimal(str(quantity))
+        steps = (value / step).to_integral_value(rounding=ROUND_HALF_UP)
+        
+        # Only absorb float noise, well below any exchange step
+        if abs(steps * step - value) > self.QTY_TOLERANCE:
+            raise ValueError(f"Quantity {quantity} is not a multiple of the {symbol.upper()} "
+                             f"step size {format(step, 'f')}")
+        
+        return format(steps * step, 'f')
+    
     def get_ticker(self, symbol: str) -> Dict:
         """Get symbol ticker price"""
         try:
@@ -100,14 +300,23 @@ class BinanceFuturesClient:
             print(f"Error getting position info: {e}")
             return []
     
-    def new_order(self, **kwargs) -> Dict:
-        """Place a new order"""
+    def new_order(self, query: bytes = b'', **kwargs) -> Dict:
+        """Place a new order, optionally from a query pre-encoded with encode_query()"""
         try:
-            return self._request('POST', '/fapi/v1/order', signed=True, **kwargs)
+            return self._request('POST', '/fapi/v1/order', signed=True, query=query, **kwargs)
         except Exception as e:
             print(f"Error placing order: {e}")
             return {'error': str(e)}
     
+    def new_batch_orders(self, batch_orders: List[Dict]) -> List[Dict]:
+        """Place up to 5 orders in a single request"""
+        try:
+            return self._request('POST', '/fapi/v1/batchOrders', signed=True,
+                               batchOrders=json.dumps(batch_orders))
+        except Exception as e:
+            print(f"Error placing batch orders: {e}")
+            return [{'error': str(e)} for _ in batch_orders]
+    
     def cancel_order(self, symbol: str, order_id: int) -> Dict:
         """Cancel an existing order"""
         try:
@@ -117,6 +326,39 @@ class BinanceFuturesClient:
             print(f"Error canceling order: {e}")
             return {'error': str(e)}
     
+    def cancel_batch_orders(self, symbol: str, order_ids: List[int]) -> List[Dict]:
+        """Cancel up to 10 orders in a single request"""
+        try:
+            return self._request('DELETE', '/fapi/v1/batchOrders', signed=True,
+                               symbol=symbol, orderIdList=json.dumps(list(order_ids)))
+        except Exception as e:
+            print(f"Error canceling batch orders: {e}")
+            return [{'error': str(e)} for _ in order_ids]
+    
+    def cancel_all_open_orders(self, symbol: str) -> Dict:
+        """Cancel every open order on a symbol"""
+        try:
+            return self._request('DELETE', '/fapi/v1/allOpenOrders', signed=True, symbol=symbol)
+        except Exception as e:
+            print(f"Error canceling all open orders: {e}")
+            return {'error': str(e)}
+    
+    def start_user_stream(self) -> str:
+        """Create a user data stream and return its listenKey"""
+        try:
+            return self._request('POST', '/fapi/v1/listenKey').get('listenKey', '')
+        except Exception as e:
+            print(f"Error starting user stream: {e}")
+            return ''
+    
+    def keepalive_user_stream(self) -> Dict:
+        """Extend the user data stream's listenKey validity by 60 minutes"""
+        try:
+            return self._request('PUT', '/fapi/v1/listenKey')
+        except Exception as e:
+            print(f"Error keeping user stream alive: {e}")
+            return {'error': str(e)}
+    
     def new_oco_order(self, **kwargs) -> Dict:
         """Place OCO order"""
         try:
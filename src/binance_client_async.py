@@ -0,0 +1,310 @@
+import asyncio
+import json
+import threading
+import time
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+import aiohttp
+import orjson
+from yarl import URL
+
+from .binance_client import BinanceFuturesClient, ORDER_BUCKET
+from .throttle import submit_bounded
+
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+# Per-symbol order locks by API key, shared by every async client of an account
+_account_symbol_locks = defaultdict(lambda: defaultdict(asyncio.Lock))
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared event loop, starting its thread on first use"""
+    global _loop
+    
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=_loop.run_forever, name='binance-async-loop')
+            thread.daemon = True
+            thread.start()
+    
+    return _loop
+
+
+async def place_many(orders: Iterable[Awaitable[Dict]], concurrency: int = 20) -> List:
+    """
+    Submit order coroutines concurrently so their round-trips overlap
+    
+    Args:
+        orders: Coroutines such as LimitOrder.place_order_async(...) calls
+        concurrency: Maximum number of orders in flight at once
+    
+    Returns:
+        Results in submission order; a raised exception is returned in place
+    """
+    return await submit_bounded(orders, concurrency, return_exceptions=True)
+
+
+class AsyncBinanceFuturesClient(BinanceFuturesClient):
+    """Binance USDT-M Futures API client with asyncio support"""
+    
+    # Seconds between listenKey keepalives (keys expire after 60 minutes)
+    USER_STREAM_KEEPALIVE = 1800
+    
+    # Seconds to wait before reconnecting a dropped user data stream
+    USER_STREAM_RECONNECT_DELAY = 5
+    
+    def __init__(self, api_key: str = None, api_secret: str = None, testnet: bool = False):
+        super().__init__(api_key, api_secret, testnet)
+        self._session = None
+        # Serializes order submissions per symbol on the event loop, across
+        # all strategies trading the same account
+        self._symbol_locks = _account_symbol_locks[api_key]
+        
+        self._user_stream_listeners = []
+        self._user_stream_lock = threading.Lock()
+        self._user_stream_task = None
+        # Incremented on every (re)connect; 0 while disconnected
+        self.user_stream_generation = 0
+        self._user_stream_connections = 0
+    
+    @classmethod
+    def from_client(cls, client: BinanceFuturesClient) -> 'AsyncBinanceFuturesClient':
+        """Build an async client sharing credentials with an existing client"""
+        if isinstance(client, cls):
+            return client
+        
+        async_client = cls(client.api_key, client.api_secret)
+        async_client.base_url = client.base_url
+        async_client.stream_url = client.stream_url
+        # Stream position updates should be visible through the original client
+        async_client.position_cache = client.position_cache
+        # Reuse the measured server time offset instead of syncing again
+        async_client._time_sync = client._time_sync
+        # Share exchange filters so quantizing on the event loop doesn't
+        # trigger a blocking exchangeInfo download there
+        async_client._symbol_filters = client._symbol_filters
+        async_client._exchange_info_state = client._exchange_info_state
+        return async_client
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Create the aiohttp session lazily inside the running loop"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={'X-MBX-APIKEY': self.api_key or ''},
+                connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300)
+            )
+        return self._session
+    
+    async def _request_async(self, method: str, endpoint: str, signed: bool = False,
+                             query: bytes = b'', **kwargs) -> Dict:
+        """Make HTTP request to Binance API without blocking the event loop"""
+        # Sync here so _encode_params never falls back to the blocking sync
+        if signed and self._time_sync_due():
+            await self._sync_time_async()
+        
+        url = f"{self.base_url}{endpoint}"
+        payload = self._encode_params(kwargs, signed, query=query,
+                                      cache_prefix=method == 'GET' or (bool(query) and not kwargs))
+        session = self._get_session()
+        # Per request rather than session-wide so the user stream websocket isn't cut off
+        timeout = aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT)
+        
+        if method in ('GET', 'DELETE'):
+            # encoded=True stops yarl from requoting the signed query string
+            request = session.request(
+                method, URL(f"{url}?{payload.decode('ascii')}" if payload else url, encoded=True),
+                timeout=timeout
+            )
+        elif method in ('POST', 'PUT'):
+            request = session.request(
+                method, url, data=payload,
+                headers={'Content-Type': 'application/x-www-form-urlencoded'},
+                timeout=timeout
+            )
+        else:
+            raise ValueError(f"Unsupported method: {method}")
+        
+        async with request as response:
+            self._update_order_count(response.headers)
+            response.raise_for_status()
+            return orjson.loads(await response.read())
+    
+    async def _sync_time_async(self):
+        """Measure the server time offset without blocking the event loop"""
+        # Marked first so concurrent requests don't start their own sync
+        self._time_sync['synced_at'] = time.monotonic()
+        
+        try:
+            sent_ms = time.time_ns() // 1_000_000
+            server_ms = (await self._request_async('GET', '/fapi/v1/time'))['serverTime']
+            received_ms = time.time_ns() // 1_000_000
+            self._time_sync['offset_ms'] = server_ms - (sent_ms + received_ms) // 2
+        except Exception as e:
+            print(f"Error syncing server time: {e}")
+    
+    async def close(self):
+        """Close the underlying aiohttp session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+    
+    async def get_open_orders_async(self, symbol: str = None) -> List[Dict]:
+        """Get all open orders"""
+        try:
+            params = {}
+            if symbol:
+                params['symbol'] = symbol
+            return await self._request_async('GET', '/fapi/v1/openOrders', signed=True, **params)
+        except Exception as e:
+            print(f"Error getting open orders: {e}")
+            return []
+    
+    async def new_order_async(self, query: bytes = b'', **kwargs) -> Dict:
+        """Place a new order, optionally from a query pre-encoded with encode_query()"""
+        try:
+            return await self._request_async('POST', '/fapi/v1/order', signed=True,
+                                             query=query, **kwargs)
+        except Exception as e:
+            print(f"Error placing order: {e}")
+            return {'error': str(e)}
+    
+    async def submit_order_async(self, symbol: str, on_response: Callable[[Dict], None],
+                                 query: bytes = b'', params: Dict = None) -> Dict:
+        """
+        Place an order under its symbol's lock after taking an order token
+        
+        Once sent, the request is shielded from caller cancellation: the symbol
+        lock stays held and on_response is called with the result when it
+        completes, so a cancelled caller never leaves an untracked order.
+        
+        Args:
+            symbol: Symbol whose orders are serialized
+            on_response: Called with the order response once it arrives
+            query: Params pre-encoded with encode_query()
+            params: Further order params
+        
+        Returns:
+            Order response
+        """
+        lock = self._symbol_locks[symbol.upper()]
+        await lock.acquire()
+        try:
+            await ORDER_BUCKET.acquire_async()
+            request = asyncio.ensure_future(self.new_order_async(query=query, **(params or {})))
+        except BaseException:
+            lock.release()
+            raise
+        
+        def finished(future: asyncio.Future):
+            lock.release()
+            if not future.cancelled() and future.exception() is None:
+                on_response(future.result())
+        
+        request.add_done_callback(finished)
+        return await asyncio.shield(request)
+    
+    async def new_batch_orders_async(self, batch_orders: List[Dict]) -> List[Dict]:
+        """Place up to 5 orders in a single request"""
+        try:
+            return await self._request_async('POST', '/fapi/v1/batchOrders', signed=True,
+                                             batchOrders=json.dumps(batch_orders))
+        except Exception as e:
+            print(f"Error placing batch orders: {e}")
+            return [{'error': str(e)} for _ in batch_orders]
+    
+    async def start_user_stream_async(self) -> str:
+        """Create a user data stream and return its listenKey"""
+        try:
+            response = await self._request_async('POST', '/fapi/v1/listenKey')
+            return response.get('listenKey', '')
+        except Exception as e:
+            print(f"Error starting user stream: {e}")
+            return ''
+    
+    async def keepalive_user_stream_async(self) -> Dict:
+        """Extend the user data stream's listenKey validity by 60 minutes"""
+        try:
+            return await self._request_async('PUT', '/fapi/v1/listenKey')
+        except Exception as e:
+            print(f"Error keeping user stream alive: {e}")
+            return {'error': str(e)}
+    
+    def subscribe_user_stream(self, callback: Callable[[Dict], None]):
+        """
+        Register a callback for user data stream events
+        
+        The stream is started on the shared background loop on first
+        subscription and callbacks are invoked on that loop's thread.
+        """
+        with self._user_stream_lock:
+            self._user_stream_listeners.append(callback)
+            
+            if self._user_stream_task is None:
+                self._user_stream_task = asyncio.run_coroutine_threadsafe(
+                    self._run_user_stream(), get_background_loop()
+                )
+    
+    async def _run_user_stream(self):
+        """Keep the user data websocket connected and dispatch its events"""
+        while True:
+            keepalive = None
+            try:
+                listen_key = await self.start_user_stream_async()
+                if not listen_key:
+                    raise ConnectionError("No listenKey returned")
+                
+                keepalive = asyncio.ensure_future(self._keepalive_user_stream())
+                
+                async with self._get_session().ws_connect(
+                        f"{self.stream_url}/ws/{listen_key}", heartbeat=60) as ws:
+                    self._user_stream_connections += 1
+                    self.user_stream_generation = self._user_stream_connections
+                    
+                    async for message in ws:
+                        if message.type == aiohttp.WSMsgType.TEXT:
+                            self._dispatch_user_event(orjson.loads(message.data))
+                        elif message.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                            break
+            
+            except Exception as e:
+                print(f"User stream error: {e}")
+            
+            finally:
+                # Updates are missed while disconnected, so cached positions go stale
+                self.user_stream_generation = 0
+                self.position_cache.clear()
+                if keepalive is not None:
+                    keepalive.cancel()
+            
+            await asyncio.sleep(self.USER_STREAM_RECONNECT_DELAY)
+    
+    async def _keepalive_user_stream(self):
+        """Periodically extend the active listenKey"""
+        while True:
+            await asyncio.sleep(self.USER_STREAM_KEEPALIVE)
+            await self.keepalive_user_stream_async()
+    
+    def _update_position_cache(self, event: Dict):
+        """Apply ACCOUNT_UPDATE position changes to position_cache"""
+        for position in event.get('a', {}).get('P', []):
+            if position.get('ps', 'BOTH') == 'BOTH':
+                self.position_cache[position['s']] = {
+                    'symbol': position['s'],
+                    'positionAmt': position['pa'],
+                    'entryPrice': position.get('ep'),
+                    'positionSide': 'BOTH'
+                }
+    
+    def _dispatch_user_event(self, event: Dict):
+        """Pass a user data event to every subscriber"""
+        if event.get('e') == 'ACCOUNT_UPDATE':
+            self._update_position_cache(event)
+        
+        for callback in list(self._user_stream_listeners):
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"Error handling user stream event: {e}")
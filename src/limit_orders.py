@@ -1,7 +1,20 @@
-
-from .binance_client import BinanceFuturesClient
+import asyncio
+from .binance_client import BinanceFuturesClient, ORDER_BUCKET
 from .logger import TradingLogger
-from typing import Dict, Optional
+from .validator import OrderValidator
+from typing import Dict, List, Optional, Tuple
+
+
+# Fields shared by every order of each type
+_BASE_LIMIT = {
+    'type': 'LIMIT',
+    'newOrderRespType': 'RESULT'
+}
+
+_BASE_LIMIT_MAKER = {
+    'type': 'LIMIT_MAKER',
+    'newOrderRespType': 'RESULT'
+}
 
 
 class LimitOrder:
@@ -32,23 +45,11 @@ class LimitOrder:
             self.logger.log("LIMIT_ORDER", 
                           f"Placing {side} limit order for {quantity} {symbol} @ {price}")
             
-            order_params = {
-                'symbol': symbol.upper(),
-                'side': side.upper(),
-                'type': 'LIMIT',
-                'quantity': round(quantity, 8),
-                'price': str(round(price, 2)),
-                'timeInForce': time_in_force,
-                'reduceOnly': reduce_only,
-                'newOrderRespType': 'RESULT'
-            }
-            
+            order_params = self._build_params(symbol, side, quantity, price,
+                                              time_in_force, reduce_only)
+            ORDER_BUCKET.acquire()
             response = self.client.new_order(**order_params)
-            
-            if 'orderId' in response:
-                self.logger.log("SUCCESS", f"Limit order placed: {response}")
-            else:
-                self.logger.log("ERROR", f"Limit order failed: {response}")
+            self._log_response(response)
             
             return response
             
@@ -57,6 +58,31 @@ class LimitOrder:
             self.logger.log("ERROR", error_msg)
             return {'error': error_msg, 'status': 'ERROR'}
     
+    async def place_order_async(self, symbol: str, side: str, quantity: float,
+                                price: float, time_in_force: str = 'GTC',
+                                reduce_only: bool = False) -> Dict:
+        """
+        Place a limit order without blocking the event loop
+        
+        Requires the order to be constructed with an AsyncBinanceFuturesClient.
+        Arguments and return value match place_order.
+        """
+        try:
+            self.logger.log("LIMIT_ORDER", 
+                          f"Placing {side} limit order for {quantity} {symbol} @ {price}")
+            
+            order_params = self._build_params(symbol, side, quantity, price,
+                                              time_in_force, reduce_only)
+            
+            # The response is logged even if this caller is cancelled mid-request
+            return await self.client.submit_order_async(order_params['symbol'], self._log_response,
+                                                        params=order_params)
+            
+        except Exception as e:
+            error_msg = f"Error placing limit order: {str(e)}"
+            self.logger.log("ERROR", error_msg)
+            return {'error': error_msg, 'status': 'ERROR'}
+    
     def place_limit_maker(self, symbol: str, side: str, quantity: float, 
                          price: float) -> Dict:
         """
@@ -75,15 +101,8 @@ class LimitOrder:
             self.logger.log("LIMIT_MAKER", 
                           f"Placing {side} limit maker order for {quantity} {symbol} @ {price}")
             
-            order_params = {
-                'symbol': symbol.upper(),
-                'side': side.upper(),
-                'type': 'LIMIT_MAKER',
-                'quantity': round(quantity, 8),
-                'price': str(round(price, 2)),
-                'newOrderRespType': 'RESULT'
-            }
-            
+            order_params = self._build_maker_params(symbol, side, quantity, price)
+            ORDER_BUCKET.acquire()
             response = self.client.new_order(**order_params)
             return response
             
@@ -91,3 +110,148 @@ class LimitOrder:
             error_msg = f"Error placing limit maker order: {str(e)}"
             self.logger.log("ERROR", error_msg)
             return {'error': error_msg, 'status': 'ERROR'}
+    
+    async def place_limit_maker_async(self, symbol: str, side: str, quantity: float,
+                                      price: float) -> Dict:
+        """
+        Place a limit maker order (post-only) without blocking the event loop
+        
+        Requires the order to be constructed with an AsyncBinanceFuturesClient.
+        Arguments and return value match place_limit_maker.
+        """
+        try:
+            self.logger.log("LIMIT_MAKER", 
+                          f"Placing {side} limit maker order for {quantity} {symbol} @ {price}")
+            
+            order_params = self._build_maker_params(symbol, side, quantity, price)
+            
+            return await self.client.submit_order_async(order_params['symbol'], self._log_response,
+                                                        params=order_params)
+            
+        except Exception as e:
+            error_msg = f"Error placing limit maker order: {str(e)}"
+            self.logger.log("ERROR", error_msg)
+            return {'error': error_msg, 'status': 'ERROR'}
+    
+    def place_batch(self, orders: List[Dict]) -> List[Dict]:
+        """
+        Place several limit orders through batchOrders, 5 per request
+        
+        Args:
+            orders: Dicts with symbol, side, quantity, price and optionally
+                time_in_force and reduce_only
+        
+        Returns:
+            One response per input order, in input order
+        """
+        results, chunks = self._prepare_batch(orders)
+        
+        for indices, batch in chunks:
+            ORDER_BUCKET.acquire(len(batch))
+            self._store_batch_results(results, indices, batch,
+                                      self.client.new_batch_orders(batch))
+        
+        return results
+    
+    async def place_batch_async(self, orders: List[Dict]) -> List[Dict]:
+        """
+        Place several limit orders through batchOrders with all requests in flight at once
+        
+        Requires the order to be constructed with an AsyncBinanceFuturesClient.
+        Arguments and return value match place_batch.
+        """
+        results, chunks = self._prepare_batch(orders)
+        
+        async def submit(batch: List[Dict]) -> List[Dict]:
+            await ORDER_BUCKET.acquire_async(len(batch))
+            return await self.client.new_batch_orders_async(batch)
+        
+        responses = await asyncio.gather(*(submit(batch) for _, batch in chunks))
+        for (indices, batch), response in zip(chunks, responses):
+            self._store_batch_results(results, indices, batch, response)
+        
+        return results
+    
+    def _prepare_batch(self, orders: List[Dict]) -> Tuple[List[Dict], List[Tuple[List[int], List[Dict]]]]:
+        """Validate orders and group the valid ones into batches of 5"""
+        results = [None] * len(orders)
+        valid = []
+        
+        for i, order in enumerate(orders):
+            is_valid, msg = OrderValidator.compile(order['symbol'])(order['quantity'], order['price'])
+            if not is_valid:
+                results[i] = {'error': msg, 'status': 'ERROR'}
+                continue
+            
+            try:
+                params = self._build_params(order['symbol'], order['side'], order['quantity'],
+                                            order['price'], order.get('time_in_force', 'GTC'),
+                                            order.get('reduce_only', False))
+            except ValueError as e:
+                results[i] = {'error': str(e), 'status': 'ERROR'}
+                continue
+            
+            # batchOrders takes string values, so send reduceOnly only when set
+            if params.pop('reduceOnly'):
+                params['reduceOnly'] = 'true'
+            valid.append((i, params))
+        
+        chunks = []
+        for start in range(0, len(valid), 5):
+            group = valid[start:start + 5]
+            chunks.append(([i for i, _ in group], [params for _, params in group]))
+        
+        self.logger.log("LIMIT_ORDER", 
+                      f"Placing {len(valid)} limit orders in {len(chunks)} batches")
+        
+        return results, chunks
+    
+    def _store_batch_results(self, results: List[Dict], indices: List[int],
+                             batch: List[Dict], responses: List[Dict]):
+        """Record one batch's responses against the original order positions"""
+        for i, order, response in zip(indices, batch, responses):
+            if 'orderId' in response:
+                self.logger.log("SUCCESS", f"Limit order placed: {response}")
+            else:
+                self.logger.log("ERROR", f"Limit order failed: {order} {response}")
+            results[i] = response
+    
+    def _build_params(self, symbol: str, side: str, quantity: float, price: float,
+                      time_in_force: str, reduce_only: bool) -> Dict:
+        """Build the request parameters for a limit order"""
+        symbol = symbol.upper()
+        quantity, price = self._format_qty_price(symbol, quantity, price)
+        return {
+            **_BASE_LIMIT,
+            'symbol': symbol,
+            'side': side.upper(),
+            'quantity': quantity,
+            'price': price,
+            'timeInForce': time_in_force,
+            'reduceOnly': reduce_only
+        }
+    
+    def _build_maker_params(self, symbol: str, side: str, quantity: float,
+                            price: float) -> Dict:
+        """Build the request parameters for a limit maker order"""
+        symbol = symbol.upper()
+        quantity, price = self._format_qty_price(symbol, quantity, price)
+        return {
+            **_BASE_LIMIT_MAKER,
+            'symbol': symbol,
+            'side': side.upper(),
+            'quantity': quantity,
+            'price': price
+        }
+    
+    def _format_qty_price(self, symbol: str, quantity: float, price: float) -> Tuple[str, str]:
+        """Format quantity and price to the symbol's exchange step and tick size"""
+        return (self.client.quantize_qty(symbol, quantity),
+                self.client.quantize_price(symbol, price))
+    
+    def _log_response(self, response: Dict):
+        """Log the outcome of a limit order request"""
+        if 'orderId' in response:
+            self.logger.log("SUCCESS", f"Limit order placed: {response}")
+        else:
+            self.logger.log("ERROR", f"Limit order failed: {response}")
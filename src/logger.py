@@ -1,43 +1,140 @@
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import os
+from logging.handlers import MemoryHandler, RotatingFileHandler, QueueHandler, QueueListener
+import queue
 import sys
-from datetime import datetime
+import threading
+import time
 import json
+import orjson
+
+
+# One background listener per log file, shared by every TradingLogger
+_listeners = {}
+_listeners_lock = threading.Lock()
+
+# TradingLogger.log level names; anything else is logged as INFO
+_LEVELS = {
+    'ERROR': logging.ERROR,
+    'WARNING': logging.WARNING,
+    'DEBUG': logging.DEBUG
+}
+
+# Records buffered before a file write; ERROR and above are written immediately
+LOG_BUFFER_SIZE = 100
+
+# One TradingLogger per log file; order classes each ask for one in __init__
+_instances = {}
+
+# (epoch second, formatted date and time) of the last timestamp, swapped atomically
+_timestamp_cache = (None, '')
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time in ISO 8601 with milliseconds, formatting each second once"""
+    global _timestamp_cache
+    
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _timestamp_cache
+    if second != cached_second:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+        _timestamp_cache = (second, prefix)
+    
+    return f"{prefix}.{nanos // 1_000_000:03d}Z"
+
+
+def _tail(path: str, n: int, chunk_size: int = 65536) -> list:
+    """Read the last n lines of a file by seeking backwards in chunks"""
+    if n <= 0:
+        return []
+    
+    with open(path, 'rb') as f:
+        position = os.stat(path).st_size
+        data = b''
+        
+        # One extra newline is needed since the file normally ends with one
+        while position > 0 and data.count(b'\n') <= n:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + data
+    
+    return data.decode('utf-8', errors='replace').splitlines()[-n:]
 
 
 class TradingLogger:
     """Structured logging for trading bot"""
     
+    def __new__(cls, log_file: str = 'bot.log'):
+        with _listeners_lock:
+            instance = _instances.get(log_file)
+            if instance is None:
+                instance = super().__new__(cls)
+                _instances[log_file] = instance
+            return instance
+    
     def __init__(self, log_file: str = 'bot.log'):
+        # Shared instances are already configured
+        if getattr(self, 'logger', None) is not None:
+            return
+        
         self.log_file = log_file
         self.setup_logger()
     
     def setup_logger(self):
         """Configure logging system"""
-        # Create formatters
-        detailed_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        
-        # File handler with rotation
-        file_handler = RotatingFileHandler(
-            self.log_file,
-            maxBytes=10485760,  # 10MB
-            backupCount=5
-        )
-        file_handler.setFormatter(detailed_formatter)
-        file_handler.setLevel(logging.INFO)
-        
-        # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(detailed_formatter)
-        console_handler.setLevel(logging.WARNING)
-        
         # Get logger
         self.logger = logging.getLogger('TradingBot')
         self.logger.setLevel(logging.INFO)
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        
+        with _listeners_lock:
+            if self.log_file in _listeners:
+                self.listener = _listeners[self.log_file]
+                self.buffer_handler = self.listener.handlers[0]
+                self.file_handler = self.buffer_handler.target
+                return
+            
+            # Create formatters
+            detailed_formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
+            
+            # File handler with rotation
+            file_handler = RotatingFileHandler(
+                self.log_file,
+                maxBytes=10485760,  # 10MB
+                backupCount=5
+            )
+            file_handler.setFormatter(detailed_formatter)
+            file_handler.setLevel(logging.INFO)
+            self.file_handler = file_handler
+            
+            # Coalesce file writes; records are already formatted by the target
+            buffer_handler = MemoryHandler(LOG_BUFFER_SIZE, flushLevel=logging.ERROR,
+                                           target=file_handler)
+            buffer_handler.setLevel(logging.INFO)
+            self.buffer_handler = buffer_handler
+            
+            # Console handler
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setFormatter(detailed_formatter)
+            console_handler.setLevel(logging.WARNING)
+            
+            # Callers only enqueue records; file and console I/O happen on the listener thread
+            log_queue = queue.Queue(-1)
+            listener = QueueListener(log_queue, buffer_handler, console_handler,
+                                     respect_handler_level=True)
+            listener.start()
+            _listeners[self.log_file] = listener
+            self.listener = listener
+            
+            # Drain queued records, then the write buffer, before the interpreter exits
+            # (atexit runs handlers in reverse registration order)
+            atexit.register(buffer_handler.flush)
+            atexit.register(listener.stop)
+            
+            self.logger.addHandler(QueueHandler(log_queue))
     
     def log(self, event_type: str, message: str, level: str = 'INFO', **kwargs):
         """
@@ -49,42 +146,62 @@ class TradingLogger:
             level: Log level (INFO, WARNING, ERROR, etc.)
             **kwargs: Additional structured data
         """
+        log_level = _LEVELS.get(level, logging.INFO)
+        
+        # Skip building the JSON entry when no handler would emit it
+        if not self.logger.isEnabledFor(log_level):
+            return
+        
         log_entry = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': _utc_timestamp(),
             'event_type': event_type,
             'level': level,
             'message': message,
             **kwargs
         }
         
-        # Convert to JSON string for file logging
-        log_message = json.dumps(log_entry)
-        
-        if level == 'ERROR':
-            self.logger.error(log_message)
-        elif level == 'WARNING':
-            self.logger.warning(log_message)
-        elif level == 'DEBUG':
-            self.logger.debug(log_message)
-        else:
-            self.logger.info(log_message)
+        # Convert to JSON string for file logging; default=str covers
+        # non-serializable kwargs such as Decimal or datetime values
+        log_message = orjson.dumps(log_entry, default=str).decode()
+        self.logger.log(log_level, log_message)
+    
+    def flush(self):
+        """Write queued and buffered log records to the log file"""
+        # Wait for the listener to hand every queued record to the buffer
+        # (it calls task_done per record); skipped once it has been stopped
+        if self.listener._thread is not None:
+            self.listener.queue.join()
+        self.buffer_handler.flush()
     
     def get_recent_logs(self, n: int = 100) -> list:
         """Get recent log entries"""
+        self.flush()
         try:
-            with open(self.log_file, 'r') as f:
-                lines = f.readlines()[-n:]
-                logs = []
-                for line in lines:
-                    try:
-                        logs.append(json.loads(line.strip()))
-                    except:
-                        logs.append({'raw': line.strip()})
-                return logs
+            lines = _tail(self.log_file, n)
         except FileNotFoundError:
             return []
+        
+        logs = []
+        for line in lines:
+            try:
+                logs.append(json.loads(line.strip()))
+            except:
+                logs.append({'raw': line.strip()})
+        return logs
     
     def clear_logs(self):
         """Clear all logs"""
-        open(self.log_file, 'w').close()
+        # Truncate under the handler's lock and reopen its stream, so the
+        # listener thread never writes through a stale descriptor
+        self.flush()
+        handler = self.file_handler
+        handler.acquire()
+        try:
+            if handler.stream:
+                handler.stream.close()
+            open(self.log_file, 'w').close()
+            handler.stream = handler._open()
+        finally:
+            handler.release()
+        
         self.log('SYSTEM', 'Logs cleared by user', level='INFO')
@@ -1,9 +1,15 @@
-
-from .binance_client import BinanceFuturesClient
+from .binance_client import BinanceFuturesClient, ORDER_BUCKET
 from .logger import TradingLogger
 from typing import Dict, Optional
 
 
+# Fields shared by every market order
+_BASE_MARKET = {
+    'type': 'MARKET',
+    'newOrderRespType': 'RESULT'  # Get full order response
+}
+
+
 class MarketOrder:
     """Market order implementation"""
     
@@ -28,32 +34,65 @@ class MarketOrder:
         try:
             self.logger.log("MARKET_ORDER", f"Placing {side} market order for {quantity} {symbol}")
             
-            order_params = {
-                'symbol': symbol.upper(),
-                'side': side.upper(),
-                'type': 'MARKET',
-                'quantity': round(quantity, 8),
-                'reduceOnly': reduce_only,
-                'newOrderRespType': 'RESULT'  # Get full order response
-            }
+            order_params = self._build_params(symbol, side, quantity, reduce_only)
+            ORDER_BUCKET.acquire()
+            response = self.client.new_order(**order_params)
+            self._log_response(response)
             
-            # Remove None values
-            order_params = {k: v for k, v in order_params.items() if v is not None}
+            return response
             
-            response = self.client.new_order(**order_params)
+        except Exception as e:
+            error_msg = f"Error placing market order: {str(e)}"
+            self.logger.log("ERROR", error_msg)
+            return {'error': error_msg, 'status': 'ERROR'}
+    
+    async def place_order_async(self, symbol: str, side: str, quantity: float,
+                                reduce_only: bool = False, query: bytes = None) -> Dict:
+        """
+        Place a market order without blocking the event loop
+        
+        Requires the order to be constructed with an AsyncBinanceFuturesClient.
+        Arguments and return value match place_order; pass query from
+        order_query() to skip rebuilding the params for repeated orders.
+        """
+        try:
+            self.logger.log("MARKET_ORDER", f"Placing {side} market order for {quantity} {symbol}")
             
-            if 'orderId' in response:
-                self.logger.log("SUCCESS", f"Market order placed: {response}")
-            else:
-                self.logger.log("ERROR", f"Market order failed: {response}")
+            if query is None:
+                query = self.order_query(symbol, side, quantity, reduce_only)
             
-            return response
+            # The response is logged even if this caller is cancelled mid-request
+            return await self.client.submit_order_async(symbol, self._log_response, query=query)
             
         except Exception as e:
             error_msg = f"Error placing market order: {str(e)}"
             self.logger.log("ERROR", error_msg)
             return {'error': error_msg, 'status': 'ERROR'}
     
+    def _build_params(self, symbol: str, side: str, quantity: float,
+                      reduce_only: bool) -> Dict:
+        """Build the request parameters for a market order"""
+        symbol = symbol.upper()
+        return {
+            **_BASE_MARKET,
+            'symbol': symbol,
+            'side': side.upper(),
+            'quantity': self.client.quantize_qty(symbol, quantity),
+            'reduceOnly': reduce_only
+        }
+    
+    def order_query(self, symbol: str, side: str, quantity: float,
+                    reduce_only: bool = False) -> bytes:
+        """Pre-encode a market order's params for repeated placement"""
+        return self.client.encode_query(**self._build_params(symbol, side, quantity, reduce_only))
+    
+    def _log_response(self, response: Dict):
+        """Log the outcome of a market order request"""
+        if 'orderId' in response:
+            self.logger.log("SUCCESS", f"Market order placed: {response}")
+        else:
+            self.logger.log("ERROR", f"Market order failed: {response}")
+    
     def close_position(self, symbol: str, side: str = None, 
                       quantity: float = None) -> Dict:
         """
@@ -68,9 +107,11 @@ class MarketOrder:
             Order response
         """
         try:
-            # Get current position
-            positions = self.client.get_position_info(symbol)
-            position = next((p for p in positions if p['symbol'] == symbol), None)
+            # Use the streamed position when available; the API filters by symbol
+            position = self.client.position_cache.get(symbol)
+            if position is None:
+                positions = self.client.get_position_info(symbol)
+                position = positions[0] if positions else None
             
             if not position or float(position['positionAmt']) == 0:
                 return {'error': 'No position to close', 'status': 'ERROR'}
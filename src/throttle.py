@@ -0,0 +1,84 @@
+import asyncio
+import threading
+import time
+from typing import Awaitable, Iterable, List
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to pace order requests"""
+    
+    def __init__(self, capacity: int, rate_per_sec: float):
+        """
+        Args:
+            capacity: Maximum number of tokens (burst size)
+            rate_per_sec: Tokens added back per second
+        """
+        self.capacity = capacity
+        self.rate_per_sec = rate_per_sec
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self):
+        """Add the tokens earned since the last update"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_sec)
+        self._updated = now
+    
+    def _try_take(self, tokens: int) -> float:
+        """Take tokens if available, otherwise return seconds until they will be"""
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate_per_sec
+    
+    def acquire(self, tokens: int = 1):
+        """Block the calling thread until tokens are available"""
+        wait = self._try_take(tokens)
+        while wait > 0:
+            time.sleep(wait)
+            wait = self._try_take(tokens)
+    
+    async def acquire_async(self, tokens: int = 1):
+        """Wait without blocking the event loop until tokens are available"""
+        wait = self._try_take(tokens)
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait = self._try_take(tokens)
+    
+    def update_from_exchange(self, used: int, limit: int):
+        """
+        Clamp available tokens to the headroom reported by the exchange
+        
+        Args:
+            used: Orders already counted against the exchange window
+            limit: Exchange order limit for that window
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, max(0, limit - used))
+
+
+async def submit_bounded(coros: Iterable[Awaitable], concurrency: int = 20,
+                         return_exceptions: bool = False) -> List:
+    """
+    Await coroutines concurrently with at most `concurrency` in flight
+    
+    Args:
+        coros: Coroutines to run
+        concurrency: Maximum number running at once
+        return_exceptions: Return raised exceptions in place of results
+    
+    Returns:
+        Results in submission order
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def limited(coro):
+        async with semaphore:
+            return await coro
+    
+    return await asyncio.gather(*(limited(coro) for coro in coros),
+                                return_exceptions=return_exceptions)
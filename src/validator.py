@@ -1,12 +1,13 @@
 import re
-from typing import Tuple, Optional
+from functools import lru_cache
+from typing import Callable, Tuple, Optional
 
 
 class OrderValidator:
     """Input validation for trading orders"""
     
     # Binance Futures trading pairs pattern
-    SYMBOL_PATTERN = r'^[A-Z]{3,10}(USDT|BUSD|BTC|ETH)$'
+    SYMBOL_RE = re.compile(r'^[A-Z]{3,10}(USDT|BUSD|BTC|ETH)$')
     
     # Minimum order quantities (Binance Futures requirements)
     MIN_QUANTITIES = {
@@ -28,135 +29,175 @@ class OrderValidator:
         'DEFAULT': 2
     }
     
-    def __init__(self):
-        self.errors = []
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _meta(symbol: str) -> Tuple[str, float, int, bool]:
+        """Get normalized symbol, min quantity, price precision and format validity"""
+        symbol = symbol.upper().strip()
+        
+        return (
+            symbol,
+            OrderValidator.MIN_QUANTITIES.get(symbol, OrderValidator.MIN_QUANTITIES['DEFAULT']),
+            OrderValidator.PRICE_PRECISIONS.get(symbol, OrderValidator.PRICE_PRECISIONS['DEFAULT']),
+            bool(OrderValidator.SYMBOL_RE.match(symbol))
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def compile(symbol: str) -> Callable[..., Tuple[bool, str]]:
+        """
+        Build a validator for one symbol with its limits bound as locals
+        
+        Args:
+            symbol: Trading pair
+        
+        Returns:
+            check(quantity, price=None) returning (is_valid, message)
+        """
+        symbol, min_qty, precision, is_valid = OrderValidator._meta(symbol)
+        
+        if not symbol:
+            symbol_error = "Symbol cannot be empty"
+        elif not is_valid:
+            symbol_error = f"Invalid symbol format: {symbol}. Expected format like BTCUSDT, ETHUSDT"
+        else:
+            symbol_error = None
+        min_qty_error = f"Minimum quantity for {symbol} is {min_qty}"
+        precision_error = f"Price precision for {symbol} is {precision} decimal places"
+        
+        def check(quantity: float, price: float = None) -> Tuple[bool, str]:
+            if symbol_error:
+                return False, symbol_error
+            if quantity <= 0:
+                return False, "Quantity must be greater than 0"
+            if quantity < min_qty:
+                return False, min_qty_error
+            if round(quantity, 8) != quantity:
+                return False, "Quantity cannot have more than 8 decimal places"
+            if price is not None:
+                if price <= 0:
+                    return False, "Price must be greater than 0"
+                if round(price, precision) != price:
+                    return False, precision_error
+            return True, "Order is valid"
+        
+        return check
     
-    def validate_symbol(self, symbol: str) -> Tuple[bool, Optional[str]]:
+    @classmethod
+    def validate_symbol(cls, symbol: str) -> Tuple[bool, Optional[str]]:
         """Validate trading symbol"""
-        symbol = symbol.upper().strip()
+        symbol, _, _, is_valid = cls._meta(symbol)
         
         if not symbol:
             return False, "Symbol cannot be empty"
         
-        if not re.match(self.SYMBOL_PATTERN, symbol):
+        if not is_valid:
             return False, f"Invalid symbol format: {symbol}. Expected format like BTCUSDT, ETHUSDT"
         
         return True, symbol
     
-    def validate_quantity(self, symbol: str, quantity: float) -> Tuple[bool, Optional[str]]:
+    @classmethod
+    def validate_quantity(cls, symbol: str, quantity: float) -> Tuple[bool, Optional[str]]:
         """Validate order quantity"""
-        symbol = symbol.upper().strip()
+        symbol, min_qty, _, _ = cls._meta(symbol)
         
         if quantity <= 0:
             return False, "Quantity must be greater than 0"
         
-        min_qty = self.MIN_QUANTITIES.get(symbol, self.MIN_QUANTITIES['DEFAULT'])
-        
         if quantity < min_qty:
             return False, f"Minimum quantity for {symbol} is {min_qty}"
         
         # Check if quantity has too many decimal places
-        if len(str(quantity).split('.')[-1]) > 8:
+        if round(quantity, 8) != quantity:
             return False, "Quantity cannot have more than 8 decimal places"
         
         return True, f"Quantity {quantity} is valid"
     
-    def validate_price(self, symbol: str, price: float) -> Tuple[bool, Optional[str]]:
+    @classmethod
+    def validate_price(cls, symbol: str, price: float) -> Tuple[bool, Optional[str]]:
         """Validate price"""
-        symbol = symbol.upper().strip()
+        symbol, _, precision, _ = cls._meta(symbol)
         
         if price <= 0:
             return False, "Price must be greater than 0"
         
-        precision = self.PRICE_PRECISIONS.get(symbol, self.PRICE_PRECISIONS['DEFAULT'])
-        
         # Check price precision
-        price_str = str(price)
-        if '.' in price_str:
-            decimals = len(price_str.split('.')[-1])
-            if decimals > precision:
-                return False, f"Price precision for {symbol} is {precision} decimal places"
+        if round(price, precision) != price:
+            return False, f"Price precision for {symbol} is {precision} decimal places"
         
         return True, f"Price {price} is valid"
     
-    def validate_market_order(self, symbol: str, quantity: float) -> bool:
-        """Validate market order inputs"""
-        self.errors = []
-        
+    @classmethod
+    def validate_market_order(cls, symbol: str,
+                              quantity: float) -> Tuple[bool, Tuple[str, ...]]:
+        """Validate market order inputs, stopping at the first error"""
         # Validate symbol
-        symbol_valid, symbol_msg = self.validate_symbol(symbol)
+        symbol_valid, symbol_msg = cls.validate_symbol(symbol)
         if not symbol_valid:
-            self.errors.append(symbol_msg)
+            return False, (symbol_msg,)
         
         # Validate quantity
-        quantity_valid, quantity_msg = self.validate_quantity(symbol, quantity)
+        quantity_valid, quantity_msg = cls.validate_quantity(symbol, quantity)
         if not quantity_valid:
-            self.errors.append(quantity_msg)
+            return False, (quantity_msg,)
         
-        return len(self.errors) == 0
+        return True, ()
     
-    def validate_limit_order(self, symbol: str, quantity: float, price: float) -> bool:
-        """Validate limit order inputs"""
-        self.errors = []
-        
+    @classmethod
+    def validate_limit_order(cls, symbol: str, quantity: float,
+                             price: float) -> Tuple[bool, Tuple[str, ...]]:
+        """Validate limit order inputs, stopping at the first error"""
         # Validate symbol
-        symbol_valid, symbol_msg = self.validate_symbol(symbol)
+        symbol_valid, symbol_msg = cls.validate_symbol(symbol)
         if not symbol_valid:
-            self.errors.append(symbol_msg)
+            return False, (symbol_msg,)
         
         # Validate quantity
-        quantity_valid, quantity_msg = self.validate_quantity(symbol, quantity)
+        quantity_valid, quantity_msg = cls.validate_quantity(symbol, quantity)
         if not quantity_valid:
-            self.errors.append(quantity_msg)
+            return False, (quantity_msg,)
         
         # Validate price
-        price_valid, price_msg = self.validate_price(symbol, price)
+        price_valid, price_msg = cls.validate_price(symbol, price)
         if not price_valid:
-            self.errors.append(price_msg)
+            return False, (price_msg,)
         
-        return len(self.errors) == 0
+        return True, ()
     
-    def validate_stop_limit_order(self, symbol: str, quantity: float, 
-                                 stop_price: float, limit_price: float) -> bool:
-        """Validate stop-limit order inputs"""
-        self.errors = []
-        
+    @classmethod
+    def validate_stop_limit_order(cls, symbol: str, quantity: float, stop_price: float,
+                                  limit_price: float) -> Tuple[bool, Tuple[str, ...]]:
+        """Validate stop-limit order inputs, stopping at the first error"""
         # Validate symbol
-        symbol_valid, symbol_msg = self.validate_symbol(symbol)
+        symbol_valid, symbol_msg = cls.validate_symbol(symbol)
         if not symbol_valid:
-            self.errors.append(symbol_msg)
+            return False, (symbol_msg,)
         
         # Validate quantity
-        quantity_valid, quantity_msg = self.validate_quantity(symbol, quantity)
+        quantity_valid, quantity_msg = cls.validate_quantity(symbol, quantity)
         if not quantity_valid:
-            self.errors.append(quantity_msg)
+            return False, (quantity_msg,)
         
-        # Validate stop price
-        stop_valid, stop_msg = self.validate_price(symbol, stop_price)
-        if not stop_valid:
-            self.errors.append(stop_msg)
+        # Validate stop and limit prices against one precision lookup
+        symbol, _, precision, _ = cls._meta(symbol)
+        for price in (stop_price, limit_price):
+            if price <= 0:
+                return False, ("Price must be greater than 0",)
+            
+            if round(price, precision) != price:
+                return False, (f"Price precision for {symbol} is {precision} decimal places",)
         
-        # Validate limit price
-        limit_valid, limit_msg = self.validate_price(symbol, limit_price)
-        if not limit_valid:
-            self.errors.append(limit_msg)
-        
-        # Remove the empty if block that was causing the indentation error
         # The price relationship validation is handled in the order placement logic
-        
-        return len(self.errors) == 0
+        return True, ()
     
-    def get_errors(self) -> list:
-        """Get validation errors"""
-        return self.errors
-    
-    def get_symbol_info(self, symbol: str) -> dict:
+    @classmethod
+    def get_symbol_info(cls, symbol: str) -> dict:
         """Get symbol information including min quantity and price precision"""
-        symbol = symbol.upper().strip()
+        symbol, min_qty, precision, is_valid = cls._meta(symbol)
         
         return {
             'symbol': symbol,
-            'min_quantity': self.MIN_QUANTITIES.get(symbol, self.MIN_QUANTITIES['DEFAULT']),
-            'price_precision': self.PRICE_PRECISIONS.get(symbol, self.PRICE_PRECISIONS['DEFAULT']),
-            'is_valid': bool(re.match(self.SYMBOL_PATTERN, symbol))
+            'min_quantity': min_qty,
+            'price_precision': precision,
+            'is_valid': is_valid
         }
@@ -1,21 +1,16 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
 from datetime import datetime
-import time
+import importlib
 import sys
+import textwrap
 import os
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.binance_client import BinanceFuturesClient
-from src.market_orders import MarketOrder
-from src.limit_orders import LimitOrder
-from src.advanced.stop_limit import StopLimitOrder
-from src.advanced.oco import OCOOrder
-from src.advanced.twap import TWAPStrategy
-from src.advanced.grid import GridStrategy
 from src.logger import TradingLogger
 from src.validator import OrderValidator
 
@@ -26,21 +21,8 @@ st.set_page_config(
     layout="wide"
 )
 
-# Initialize session state
-if 'logged_in' not in st.session_state:
-    st.session_state.logged_in = False
-if 'client' not in st.session_state:
-    st.session_state.client = None
-if 'orders' not in st.session_state:
-    st.session_state.orders = []
-if 'balance' not in st.session_state:
-    st.session_state.balance = 0
-
-# Initialize logger
-logger = TradingLogger()
-
-# Custom CSS
-st.markdown("""
+# Static page content, rendered through cached accessors
+CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -71,7 +53,267 @@ st.markdown("""
         text-align: center;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# "About" panel shown beside each order form
+ABOUT_TEXT = {
+    'market': """
+    ### ℹ️ About Market Orders
+    
+    **Market orders** are executed immediately at the best available current price.
+    
+    **Features:**
+    - Instant execution
+    - No price guarantee
+    - Best for quick entries/exits
+    - Subject to slippage
+    
+    **Use when:**
+    - Speed is critical
+    - Trading liquid markets
+    - Accepting current market price
+    """,
+    'limit': """
+    ### ℹ️ About Limit Orders
+    
+    **Limit orders** execute only at your specified price or better.
+    
+    **Features:**
+    - Price control
+    - No slippage
+    - May not fill immediately
+    - Good for specific price targets
+    
+    **Use when:**
+    - You have a target price
+    - Willing to wait for execution
+    - Avoiding slippage
+    """,
+    'stop_limit': """
+    ### ℹ️ About Stop-Limit Orders
+    
+    **Stop-Limit orders** combine stop and limit orders.
+    
+    **How it works:**
+    1. When stop price is reached → becomes a limit order
+    2. Executes at limit price or better
+    
+    **Features:**
+    - Risk management
+    - Price protection
+    - Two-stage execution
+    
+    **Common use:**
+    - Stop losses with price limits
+    - Breakout entries
+    - Risk-controlled exits
+    """,
+    'oco': """
+    ### ℹ️ About OCO Orders
+    
+    **OCO orders** place two orders simultaneously:
+    
+    1. **Take Profit** (limit order)
+    2. **Stop Loss** (stop-limit order)
+    
+    **Features:**
+    - Automatic risk management
+    - Two orders, one cancels other
+    - Set and forget strategy
+    
+    **Perfect for:**
+    - Position management
+    - Risk-reward optimization
+    - Automated exit strategy
+    """,
+    'twap': """
+    ### ℹ️ About TWAP
+    
+    **TWAP** splits large orders into smaller chunks over time.
+    
+    **Benefits:**
+    - Reduces market impact
+    - Averages entry/exit price
+    - Avoids price manipulation
+    
+    **How it works:**
+    1. Divide total quantity into N chunks
+    2. Execute chunks at regular intervals
+    3. Achieve average market price
+    
+    **Ideal for:**
+    - Large orders
+    - Illiquid markets
+    - Minimizing slippage
+    """,
+    'grid': """
+    ### ℹ️ About Grid Trading
+    
+    **Grid trading** places multiple buy/sell orders within a price range.
+    
+    **Strategy:**
+    - Buy low, sell high automatically
+    - Profits from volatility
+    - Continuous trading within range
+    
+    **How it works:**
+    1. Define price range
+    2. Place limit orders at grid levels
+    3. Automatically execute when prices hit levels
+    
+    **Best for:**
+    - Range-bound markets
+    - High volatility
+    - Automated profit-taking
+    """
+}
+
+
+@st.cache_data
+def _css() -> str:
+    return CSS
+
+
+@st.cache_data
+def _about(name: str) -> str:
+    return textwrap.dedent(ABOUT_TEXT[name])
+
+
+# Column types for the order history; Binance's enum fields are stored as categories
+ORDER_DTYPES = {
+    'symbol': 'string',
+    'side': pd.CategoricalDtype(['BUY', 'SELL']),
+    'type': pd.CategoricalDtype(['LIMIT', 'MARKET', 'STOP', 'STOP_MARKET', 'TAKE_PROFIT',
+                                 'TAKE_PROFIT_MARKET', 'TRAILING_STOP_MARKET']),
+    'quantity': 'float32',
+    'status': pd.CategoricalDtype(['NEW', 'PARTIALLY_FILLED', 'FILLED', 'CANCELED',
+                                   'REJECTED', 'EXPIRED', 'EXPIRED_IN_MATCH']),
+    'timestamp': 'datetime64[ns]'
+}
+ORDER_COLUMNS = list(ORDER_DTYPES)
+
+# Order response fields read for history columns named differently
+ORDER_RESPONSE_FIELDS = {'quantity': 'origQty'}
+
+# Most recent orders kept in the history; older rows are dropped
+ORDERS_MAX_ROWS = 1000
+
+# Order history rows shown per page
+ORDERS_PAGE_SIZE = 5
+
+# Initialize session state
+if 'logged_in' not in st.session_state:
+    st.session_state.logged_in = False
+if 'client' not in st.session_state:
+    st.session_state.client = None
+if 'orders_df' not in st.session_state:
+    st.session_state.orders_df = pd.DataFrame(columns=ORDER_COLUMNS).astype(ORDER_DTYPES)
+if 'balance' not in st.session_state:
+    st.session_state.balance = 0
+
+# Initialize logger
+logger = TradingLogger()
+
+
+# Cached API access; leading-underscore args are not hashed by Streamlit
+@st.cache_resource
+def _get_client(api_key: str, api_secret: str) -> BinanceFuturesClient:
+    return BinanceFuturesClient(api_key, api_secret)
+
+
+@st.cache_data(ttl=5)
+def _get_account_info(_client: BinanceFuturesClient, api_key: str, api_secret: str) -> dict:
+    return _client.get_account_info()
+
+
+# A 1s TTL absorbs the rerun on every keystroke while prices stay fresh
+@st.cache_data(ttl=1, show_spinner=False)
+def _get_ticker(_client: BinanceFuturesClient, symbol: str) -> dict:
+    ticker = _client.get_ticker(symbol)
+    # get_ticker returns {} on failure; raising keeps that out of the cache
+    if 'lastPrice' not in ticker:
+        raise ValueError(f"No ticker for {symbol}")
+    return ticker
+
+
+def _price_metric(symbol: str):
+    """Show a symbol's last price from the shared ticker cache and return it (None if unavailable)"""
+    # Malformed symbols are never sent; failed lookups raise, so they aren't cached
+    is_symbol, symbol = OrderValidator.validate_symbol(symbol)
+    if not is_symbol:
+        return None
+    
+    try:
+        current_price = float(_get_ticker(st.session_state.client, symbol)['lastPrice'])
+    except Exception:
+        return None
+    
+    st.metric("Current Price", f"${current_price:,.2f}")
+    return current_price
+
+
+# Order and strategy handlers, built once per connected account; modules are
+# imported on first use so a session only loads the tabs it actually uses
+_HANDLERS = {
+    'market': ('src.market_orders', 'MarketOrder'),
+    'limit': ('src.limit_orders', 'LimitOrder'),
+    'stop_limit': ('src.advanced.stop_limit', 'StopLimitOrder'),
+    'oco': ('src.advanced.oco', 'OCOOrder'),
+    'twap': ('src.advanced.twap', 'TWAPStrategy'),
+    'grid': ('src.advanced.grid', 'GridStrategy')
+}
+
+
+# Keyed on the full credentials like _get_client, so a handler is never
+# bound to another secret's client
+@st.cache_resource
+def _get_handler(_client: BinanceFuturesClient, api_key: str, api_secret: str, name: str):
+    module, cls = _HANDLERS[name]
+    return getattr(importlib.import_module(module), cls)(_client)
+
+
+def _handler(name: str):
+    """Get the cached handler for the connected client"""
+    client = st.session_state.client
+    return _get_handler(client, client.api_key, client.api_secret, name)
+
+
+@st.cache_data(ttl=2, show_spinner=False)
+def _read_log_tail(path: str, kb: int, mtime: float, size: int) -> str:
+    """Read the last kb kilobytes of a log; mtime and size key the cache"""
+    with open(path, 'rb') as f:
+        f.seek(max(0, size - kb * 1024))
+        return f.read().decode('utf-8', 'replace')
+
+
+@st.cache_data(show_spinner=False)
+def _records_df(key: str, _records: list) -> pd.DataFrame:
+    """Build a strategy's plan or levels table once; key is its strategy or grid id"""
+    return pd.DataFrame(_records)
+
+
+def _record_order(result: dict):
+    """Append an order response to the history, keeping its column types"""
+    row = {column: result.get(ORDER_RESPONSE_FIELDS.get(column, column))
+           for column in ORDER_COLUMNS[:-1]}
+    row['timestamp'] = datetime.now()
+    
+    # Values outside a category column's set are recorded as missing
+    for column, dtype in ORDER_DTYPES.items():
+        if isinstance(dtype, pd.CategoricalDtype) and row[column] not in dtype.categories:
+            row[column] = None
+    
+    # loc-enlargement would infer object dtypes for the new row, so concat a typed
+    # one onto the newest ORDERS_MAX_ROWS - 1 rows to keep the history bounded
+    st.session_state.orders_df = pd.concat(
+        [st.session_state.orders_df.iloc[-(ORDERS_MAX_ROWS - 1):],
+         pd.DataFrame([row]).astype(ORDER_DTYPES)],
+        ignore_index=True
+    )
+
+
+# Custom CSS
+st.markdown(_css(), unsafe_allow_html=True)
 
 # Title
 st.markdown('<h1 class="main-header">📈 Binance Futures Trading Bot</h1>', unsafe_allow_html=True)
@@ -85,8 +327,8 @@ with st.sidebar:
     
     if st.button("Connect to Binance"):
         try:
-            client = BinanceFuturesClient(api_key, api_secret)
-            account_info = client.get_account_info()
+            client = _get_client(api_key, api_secret)
+            account_info = _get_account_info(client, api_key, api_secret)
             
             if account_info:
                 st.session_state.client = client
@@ -104,69 +346,85 @@ with st.sidebar:
         st.markdown("---")
         st.header("📊 Account Info")
         
-        # Display balance
-        st.markdown(f"""
-        <div class="balance-card">
-            <h3>💰 Total Balance</h3>
-            <h2>${st.session_state.balance:,.2f}</h2>
-        </div>
-        """, unsafe_allow_html=True)
+        # Balance slot, filled after the refresh button so a refresh shows in the same run
+        balance_card = st.empty()
         
         # Refresh button
         if st.button("Refresh Balance"):
             try:
-                account_info = st.session_state.client.get_account_info()
+                # Bypass the 5s cache so the refresh always shows a fresh balance
+                _get_account_info.clear()
+                client = st.session_state.client
+                account_info = _get_account_info(client, client.api_key, client.api_secret)
                 st.session_state.balance = account_info.get('totalWalletBalance', 0)
-                st.rerun()
             except Exception as e:
                 st.error(f"Failed to refresh: {str(e)}")
         
+        # Display balance
+        balance_card.markdown(f"""
+        <div class="balance-card">
+            <h3>💰 Total Balance</h3>
+            <h2>${st.session_state.balance:,.2f}</h2>
+        </div>
+        """, unsafe_allow_html=True)
+        
         st.markdown("---")
         st.header("📋 Order History")
         
-        # Display recent orders
-        if st.session_state.orders:
-            df_orders = pd.DataFrame(st.session_state.orders[-5:])
-            st.dataframe(df_orders[['symbol', 'side', 'type', 'quantity', 'status', 'timestamp']])
+        # Display recent orders, newest page first; nothing renders until expanded
+        df_orders = st.session_state.orders_df
+        if len(df_orders):
+            with st.expander(f"Recent orders ({len(df_orders)})"):
+                pages = -(-len(df_orders) // ORDERS_PAGE_SIZE)
+                page = st.number_input("Page", min_value=1, max_value=pages, value=1,
+                                       key="orders_page")
+                end = len(df_orders) - (page - 1) * ORDERS_PAGE_SIZE
+                st.dataframe(df_orders.iloc[max(0, end - ORDERS_PAGE_SIZE):end])
         
         # View logs button
+        log_kb = st.number_input("KB of logs to show", min_value=8, max_value=1024, value=64)
         if st.button("View Logs"):
             try:
-                with open('bot.log', 'r') as f:
-                    logs = f.read()
+                logger.flush()
+                stat = os.stat(logger.log_file)
+                logs = _read_log_tail(logger.log_file, log_kb, stat.st_mtime, stat.st_size)
                 st.text_area("Trading Logs", logs, height=300)
             except:
                 st.warning("No logs available yet")
 
 # Main Content Area
 if st.session_state.logged_in:
-    # Create tabs for different order types
-    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+    # Only the selected order type's section runs on each rerun
+    tab1, tab2, tab3, tab4, tab5, tab6 = tabs = [
         "📊 Market Orders", 
         "🎯 Limit Orders", 
         "🛑 Stop-Limit", 
         "🔄 OCO Orders", 
         "⏱️ TWAP", 
         "📊 Grid Trading"
-    ])
+    ]
+    active_tab = st.radio("Order type", tabs, horizontal=True, label_visibility="collapsed")
     
     # Tab 1: Market Orders
-    with tab1:
+    if active_tab == tab1:
         st.header("Market Orders")
         
         col1, col2 = st.columns(2)
         
         with col1:
-            symbol = st.text_input("Symbol (e.g., BTCUSDT)", value="BTCUSDT", key="market_symbol")
-            side = st.selectbox("Side", ["BUY", "SELL"], key="market_side")
-            quantity = st.number_input("Quantity", min_value=0.001, value=0.01, step=0.001, key="market_qty")
+            with st.form("market_form"):
+                symbol = st.text_input("Symbol (e.g., BTCUSDT)", value="BTCUSDT", key="market_symbol")
+                side = st.selectbox("Side", ["BUY", "SELL"], key="market_side")
+                quantity = st.number_input("Quantity", min_value=0.001, value=0.01, step=0.001, key="market_qty")
+                
+                submitted = st.form_submit_button("Place Market Order")
             
-            if st.button("Place Market Order", key="market_btn"):
+            if submitted:
                 try:
                     # Validate inputs
-                    validator = OrderValidator()
-                    if validator.validate_market_order(symbol, quantity):
-                        market_order = MarketOrder(st.session_state.client)
+                    is_valid, validation_msg = OrderValidator.compile(symbol)(quantity)
+                    if is_valid:
+                        market_order = _handler('market')
                         result = market_order.place_order(
                             symbol=symbol,
                             side=side,
@@ -174,56 +432,42 @@ if st.session_state.logged_in:
                         )
                         
                         if result['status'] == 'FILLED':
-                            st.session_state.orders.append({
-                                **result,
-                                'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                            })
+                            _record_order(result)
                             st.success(f"✅ Market order placed successfully!")
                             st.json(result)
                             logger.log("ORDER", f"Market {side} {quantity} {symbol}: {result}")
                         else:
-                            st.error(f"Order failed: {result.get('msg', 'Unknown error')}")
+                            st.error(f"Order failed: {result.get('msg') or result.get('error', 'Unknown error')}")
                     else:
-                        st.error("Validation failed. Check your inputs.")
+                        st.error(f"Validation failed: {validation_msg}")
                 except Exception as e:
                     st.error(f"Error: {str(e)}")
                     logger.log("ERROR", f"Market order failed: {str(e)}")
         
         with col2:
-            st.markdown("""
-            ### ℹ️ About Market Orders
-            
-            **Market orders** are executed immediately at the best available current price.
-            
-            **Features:**
-            - Instant execution
-            - No price guarantee
-            - Best for quick entries/exits
-            - Subject to slippage
-            
-            **Use when:**
-            - Speed is critical
-            - Trading liquid markets
-            - Accepting current market price
-            """)
+            _price_metric(symbol)
+            st.markdown(_about('market'))
     
     # Tab 2: Limit Orders
-    with tab2:
+    elif active_tab == tab2:
         st.header("Limit Orders")
         
         col1, col2 = st.columns(2)
         
         with col1:
-            symbol = st.text_input("Symbol (e.g., BTCUSDT)", value="BTCUSDT", key="limit_symbol")
-            side = st.selectbox("Side", ["BUY", "SELL"], key="limit_side")
-            quantity = st.number_input("Quantity", min_value=0.001, value=0.01, step=0.001, key="limit_qty")
-            price = st.number_input("Price", min_value=0.01, value=50000.0, step=1.0, key="limit_price")
+            with st.form("limit_form"):
+                symbol = st.text_input("Symbol (e.g., BTCUSDT)", value="BTCUSDT", key="limit_symbol")
+                side = st.selectbox("Side", ["BUY", "SELL"], key="limit_side")
+                quantity = st.number_input("Quantity", min_value=0.001, value=0.01, step=0.001, key="limit_qty")
+                price = st.number_input("Price", min_value=0.01, value=50000.0, step=1.0, key="limit_price")
+                
+                submitted = st.form_submit_button("Place Limit Order")
             
-            if st.button("Place Limit Order", key="limit_btn"):
+            if submitted:
                 try:
-                    validator = OrderValidator()
-                    if validator.validate_limit_order(symbol, quantity, price):
-                        limit_order = LimitOrder(st.session_state.client)
+                    is_valid, validation_msg = OrderValidator.compile(symbol)(quantity, price)
+                    if is_valid:
+                        limit_order = _handler('limit')
                         result = limit_order.place_order(
                             symbol=symbol,
                             side=side,
@@ -232,70 +476,53 @@ if st.session_state.logged_in:
                         )
                         
                         if result['status'] == 'NEW':
-                            st.session_state.orders.append({
-                                **result,
-                                'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                            })
+                            _record_order(result)
                             st.success(f"✅ Limit order placed successfully!")
                             st.json(result)
                             logger.log("ORDER", f"Limit {side} {quantity} {symbol} @ {price}: {result}")
                         else:
-                            st.error(f"Order failed: {result.get('msg', 'Unknown error')}")
+                            st.error(f"Order failed: {result.get('msg') or result.get('error', 'Unknown error')}")
                     else:
-                        st.error("Validation failed. Check your inputs.")
+                        st.error(f"Validation failed: {validation_msg}")
                 except Exception as e:
                     st.error(f"Error: {str(e)}")
                     logger.log("ERROR", f"Limit order failed: {str(e)}")
         
         with col2:
             # Get current price
-            try:
-                ticker = st.session_state.client.get_ticker(symbol)
-                current_price = float(ticker['lastPrice'])
-                st.metric("Current Price", f"${current_price:,.2f}")
-                
+            current_price = _price_metric(symbol)
+            if current_price:
                 # Price comparison
                 if 'price' in locals():
                     diff_percent = ((price - current_price) / current_price) * 100
                     st.metric("Price Difference", f"{diff_percent:.2f}%")
-            except:
+            else:
                 st.info("Enter a valid symbol to see price data")
             
-            st.markdown("""
-            ### ℹ️ About Limit Orders
-            
-            **Limit orders** execute only at your specified price or better.
-            
-            **Features:**
-            - Price control
-            - No slippage
-            - May not fill immediately
-            - Good for specific price targets
-            
-            **Use when:**
-            - You have a target price
-            - Willing to wait for execution
-            - Avoiding slippage
-            """)
+            st.markdown(_about('limit'))
     
     # Tab 3: Stop-Limit Orders
-    with tab3:
+    elif active_tab == tab3:
         st.header("Stop-Limit Orders")
         
         col1, col2 = st.columns(2)
         
         with col1:
-            symbol = st.text_input("Symbol", value="BTCUSDT", key="stop_symbol")
-            side = st.selectbox("Side", ["BUY", "SELL"], key="stop_side")
-            quantity = st.number_input("Quantity", min_value=0.001, value=0.01, step=0.001, key="stop_qty")
-            stop_price = st.number_input("Stop Price", min_value=0.01, value=52000.0, step=1.0, key="stop_price")
-            limit_price = st.number_input("Limit Price", min_value=0.01, value=51950.0, step=1.0, key="limit_price2")
+            with st.form("stop_form"):
+                symbol = st.text_input("Symbol", value="BTCUSDT", key="stop_symbol")
+                side = st.selectbox("Side", ["BUY", "SELL"], key="stop_side")
+                quantity = st.number_input("Quantity", min_value=0.001, value=0.01, step=0.001, key="stop_qty")
+                stop_price = st.number_input("Stop Price", min_value=0.01, value=52000.0, step=1.0, key="stop_price")
+                limit_price = st.number_input("Limit Price", min_value=0.01, value=51950.0, step=1.0, key="limit_price2")
+                
+                submitted = st.form_submit_button("Place Stop-Limit Order")
             
-            if st.button("Place Stop-Limit Order", key="stop_btn"):
+            if submitted:
                 try:
-                    validator = OrderValidator()
-                    if validator.validate_stop_limit_order(symbol, quantity, stop_price, limit_price):
-                        stop_limit = StopLimitOrder(st.session_state.client)
+                    is_valid, errors = OrderValidator.validate_stop_limit_order(
+                        symbol, quantity, stop_price, limit_price)
+                    if is_valid:
+                        stop_limit = _handler('stop_limit')
                         result = stop_limit.place_order(
                             symbol=symbol,
                             side=side,
@@ -305,63 +532,46 @@ if st.session_state.logged_in:
                         )
                         
                         if result['status'] == 'NEW':
-                            st.session_state.orders.append({
-                                **result,
-                                'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                            })
+                            _record_order(result)
                             st.success(f"✅ Stop-Limit order placed successfully!")
                             st.json(result)
                             logger.log("ORDER", f"Stop-Limit {side} {quantity} {symbol}: {result}")
                         else:
-                            st.error(f"Order failed: {result.get('msg', 'Unknown error')}")
+                            st.error(f"Order failed: {result.get('msg') or result.get('error', 'Unknown error')}")
                     else:
-                        st.error("Validation failed. Check your inputs.")
+                        st.error(f"Validation failed: {'; '.join(errors)}")
                 except Exception as e:
                     st.error(f"Error: {str(e)}")
                     logger.log("ERROR", f"Stop-Limit order failed: {str(e)}")
         
         with col2:
-            st.markdown("""
-            ### ℹ️ About Stop-Limit Orders
-            
-            **Stop-Limit orders** combine stop and limit orders.
-            
-            **How it works:**
-            1. When stop price is reached → becomes a limit order
-            2. Executes at limit price or better
-            
-            **Features:**
-            - Risk management
-            - Price protection
-            - Two-stage execution
-            
-            **Common use:**
-            - Stop losses with price limits
-            - Breakout entries
-            - Risk-controlled exits
-            """)
+            _price_metric(symbol)
+            st.markdown(_about('stop_limit'))
     
     # Tab 4: OCO Orders
-    with tab4:
+    elif active_tab == tab4:
         st.header("OCO (One-Cancels-the-Other) Orders")
         
         col1, col2 = st.columns([2, 1])
         
         with col1:
-            symbol = st.text_input("Symbol", value="BTCUSDT", key="oco_symbol")
-            side = st.selectbox("Side", ["BUY", "SELL"], key="oco_side")
-            quantity = st.number_input("Quantity", min_value=0.001, value=0.01, step=0.001, key="oco_qty")
-            
-            st.subheader("Take Profit Order")
-            take_profit_price = st.number_input("Take Profit Price", min_value=0.01, value=53000.0, step=1.0)
-            
-            st.subheader("Stop Loss Order")
-            stop_loss_price = st.number_input("Stop Loss Price", min_value=0.01, value=49000.0, step=1.0)
-            stop_limit_price = st.number_input("Stop Limit Price", min_value=0.01, value=48950.0, step=1.0)
+            with st.form("oco_form"):
+                symbol = st.text_input("Symbol", value="BTCUSDT", key="oco_symbol")
+                side = st.selectbox("Side", ["BUY", "SELL"], key="oco_side")
+                quantity = st.number_input("Quantity", min_value=0.001, value=0.01, step=0.001, key="oco_qty")
+                
+                st.subheader("Take Profit Order")
+                take_profit_price = st.number_input("Take Profit Price", min_value=0.01, value=53000.0, step=1.0)
+                
+                st.subheader("Stop Loss Order")
+                stop_loss_price = st.number_input("Stop Loss Price", min_value=0.01, value=49000.0, step=1.0)
+                stop_limit_price = st.number_input("Stop Limit Price", min_value=0.01, value=48950.0, step=1.0)
+                
+                submitted = st.form_submit_button("Place OCO Order")
             
-            if st.button("Place OCO Order", key="oco_btn"):
+            if submitted:
                 try:
-                    oco_order = OCOOrder(st.session_state.client)
+                    oco_order = _handler('oco')
                     result = oco_order.place_order(
                         symbol=symbol,
                         side=side,
@@ -371,50 +581,39 @@ if st.session_state.logged_in:
                         stop_limit_price=stop_limit_price
                     )
                     
-                    if result:
+                    if 'orderListId' in result:
                         st.success(f"✅ OCO order placed successfully!")
                         st.json(result)
                         logger.log("ORDER", f"OCO {side} {quantity} {symbol}: {result}")
+                    else:
+                        st.error(f"Order failed: {result.get('msg') or result.get('error', 'Unknown error')}")
                 except Exception as e:
                     st.error(f"Error: {str(e)}")
                     logger.log("ERROR", f"OCO order failed: {str(e)}")
         
         with col2:
-            st.markdown("""
-            ### ℹ️ About OCO Orders
-            
-            **OCO orders** place two orders simultaneously:
-            
-            1. **Take Profit** (limit order)
-            2. **Stop Loss** (stop-limit order)
-            
-            **Features:**
-            - Automatic risk management
-            - Two orders, one cancels other
-            - Set and forget strategy
-            
-            **Perfect for:**
-            - Position management
-            - Risk-reward optimization
-            - Automated exit strategy
-            """)
+            _price_metric(symbol)
+            st.markdown(_about('oco'))
     
     # Tab 5: TWAP Strategy
-    with tab5:
+    elif active_tab == tab5:
         st.header("TWAP (Time-Weighted Average Price)")
         
         col1, col2 = st.columns(2)
         
         with col1:
-            symbol = st.text_input("Symbol", value="BTCUSDT", key="twap_symbol")
-            side = st.selectbox("Side", ["BUY", "SELL"], key="twap_side")
-            total_quantity = st.number_input("Total Quantity", min_value=0.01, value=0.1, step=0.01)
-            duration_hours = st.slider("Duration (hours)", 1, 24, 4)
-            chunks = st.slider("Number of Chunks", 2, 100, 10)
+            with st.form("twap_form"):
+                symbol = st.text_input("Symbol", value="BTCUSDT", key="twap_symbol")
+                side = st.selectbox("Side", ["BUY", "SELL"], key="twap_side")
+                total_quantity = st.number_input("Total Quantity", min_value=0.01, value=0.1, step=0.01)
+                duration_hours = st.slider("Duration (hours)", 1, 24, 4)
+                chunks = st.slider("Number of Chunks", 2, 100, 10)
+                
+                submitted = st.form_submit_button("Start TWAP Strategy")
             
-            if st.button("Start TWAP Strategy", key="twap_btn"):
+            if submitted:
                 try:
-                    twap = TWAPStrategy(st.session_state.client)
+                    twap = _handler('twap')
                     result = twap.execute(
                         symbol=symbol,
                         side=side,
@@ -423,48 +622,38 @@ if st.session_state.logged_in:
                         chunks=chunks
                     )
                     
-                    if result:
+                    if result.get('status') == 'STARTED':
                         st.success(f"✅ TWAP strategy started!")
                         
-                        # Display execution plan
-                        df_plan = pd.DataFrame(result['execution_plan'])
-                        st.dataframe(df_plan)
-                        
-                        # Progress bar
-                        progress_bar = st.progress(0)
-                        
-                        # Simulate execution (in real app, this would be async)
-                        for i in range(chunks):
-                            time.sleep(0.1)  # Simulate delay
-                            progress_bar.progress((i + 1) / chunks)
-                        
-                        st.success("Strategy completed!")
+                        # The strategy runs in the background; plan and progress are shown below
+                        st.session_state.twap_result = result
+                        st.session_state.twap_progress = (result['strategy_id'], chunks)
                         logger.log("STRATEGY", f"TWAP {side} {total_quantity} {symbol}: {result}")
+                    else:
+                        st.error(f"TWAP failed: {result.get('error', 'Unknown error')}")
                 except Exception as e:
                     st.error(f"Error: {str(e)}")
                     logger.log("ERROR", f"TWAP failed: {str(e)}")
+            
+            # Execution plan of the last started strategy, kept across reruns
+            if 'twap_result' in st.session_state:
+                twap_result = st.session_state.twap_result
+                st.dataframe(_records_df(twap_result['strategy_id'], twap_result['execution_plan']))
+            
+            # Progress of the last started strategy, read without blocking the script
+            if 'twap_progress' in st.session_state:
+                strategy_id, total_chunks = st.session_state.twap_progress
+                status = _handler('twap').get_strategy_status(strategy_id)
+                if status:
+                    completed = status.get('chunks_completed', 0)
+                    st.progress(completed / total_chunks)
+                    st.caption(f"{strategy_id}: {status.get('status')} "
+                               f"({completed}/{total_chunks} chunks)")
+                    st.button("Refresh Progress", key="twap_refresh")
         
         with col2:
-            st.markdown("""
-            ### ℹ️ About TWAP
-            
-            **TWAP** splits large orders into smaller chunks over time.
-            
-            **Benefits:**
-            - Reduces market impact
-            - Averages entry/exit price
-            - Avoids price manipulation
-            
-            **How it works:**
-            1. Divide total quantity into N chunks
-            2. Execute chunks at regular intervals
-            3. Achieve average market price
-            
-            **Ideal for:**
-            - Large orders
-            - Illiquid markets
-            - Minimizing slippage
-            """)
+            _price_metric(symbol)
+            st.markdown(_about('twap'))
             
             # TWAP calculation example
             if 'total_quantity' in locals() and 'chunks' in locals():
@@ -474,26 +663,29 @@ if st.session_state.logged_in:
                 st.metric("Interval (min)", f"{interval:.1f}")
     
     # Tab 6: Grid Trading
-    with tab6:
+    elif active_tab == tab6:
         st.header("Grid Trading Strategy")
         
         col1, col2 = st.columns(2)
         
         with col1:
-            symbol = st.text_input("Symbol", value="BTCUSDT", key="grid_symbol")
-            grid_type = st.selectbox("Grid Type", ["Arithmetic", "Geometric"])
-            
-            st.subheader("Price Range")
-            lower_price = st.number_input("Lower Price", min_value=0.01, value=48000.0, step=1.0)
-            upper_price = st.number_input("Upper Price", min_value=0.01, value=52000.0, step=1.0)
-            
-            st.subheader("Grid Settings")
-            grid_lines = st.slider("Number of Grid Lines", 2, 50, 10)
-            order_qty = st.number_input("Order Quantity per Grid", min_value=0.001, value=0.005, step=0.001)
+            with st.form("grid_form"):
+                symbol = st.text_input("Symbol", value="BTCUSDT", key="grid_symbol")
+                grid_type = st.selectbox("Grid Type", ["Arithmetic", "Geometric"])
+                
+                st.subheader("Price Range")
+                lower_price = st.number_input("Lower Price", min_value=0.01, value=48000.0, step=1.0)
+                upper_price = st.number_input("Upper Price", min_value=0.01, value=52000.0, step=1.0)
+                
+                st.subheader("Grid Settings")
+                grid_lines = st.slider("Number of Grid Lines", 2, 50, 10)
+                order_qty = st.number_input("Order Quantity per Grid", min_value=0.001, value=0.005, step=0.001)
+                
+                submitted = st.form_submit_button("Start Grid Trading")
             
-            if st.button("Start Grid Trading", key="grid_btn"):
+            if submitted:
                 try:
-                    grid = GridStrategy(st.session_state.client)
+                    grid = _handler('grid')
                     result = grid.setup_grid(
                         symbol=symbol,
                         lower_price=lower_price,
@@ -503,89 +695,83 @@ if st.session_state.logged_in:
                         grid_type=grid_type
                     )
                     
-                    if result:
+                    if result.get('status') == 'INITIALIZED':
                         st.success(f"✅ Grid strategy set up!")
                         
-                        # Display grid levels
-                        df_grid = pd.DataFrame(result['grid_levels'])
-                        st.dataframe(df_grid)
-                        
-                        # Visualization
-                        fig = go.Figure()
-                        
-                        # Add price range
-                        fig.add_shape(
-                            type="rect",
-                            x0=0, x1=1,
-                            y0=lower_price, y1=upper_price,
-                            fillcolor="lightblue",
-                            opacity=0.2,
-                            line_width=0
-                        )
-                        
-                        # Add grid lines
-                        for level in result['grid_levels']:
-                            fig.add_hline(
-                                y=level['price'],
-                                line_dash="dot",
-                                line_color="gray",
-                                opacity=0.5
-                            )
-                        
-                        # Add buy/sell markers
-                        buy_levels = [level['price'] for level in result['grid_levels'] if level['side'] == 'BUY']
-                        sell_levels = [level['price'] for level in result['grid_levels'] if level['side'] == 'SELL']
-                        
-                        fig.add_trace(go.Scatter(
-                            x=[0.5] * len(buy_levels),
-                            y=buy_levels,
-                            mode='markers',
-                            marker=dict(symbol='triangle-up', size=15, color='green'),
-                            name='Buy Levels'
-                        ))
-                        
-                        fig.add_trace(go.Scatter(
-                            x=[0.5] * len(sell_levels),
-                            y=sell_levels,
-                            mode='markers',
-                            marker=dict(symbol='triangle-down', size=15, color='red'),
-                            name='Sell Levels'
-                        ))
-                        
-                        fig.update_layout(
-                            title="Grid Trading Levels",
-                            yaxis_title="Price",
-                            showlegend=True,
-                            height=400
-                        )
-                        
-                        st.plotly_chart(fig, use_container_width=True)
+                        # Levels and chart are drawn below so they survive reruns
+                        st.session_state.grid_result = (result, lower_price, upper_price)
                         logger.log("STRATEGY", f"Grid {symbol} {lower_price}-{upper_price}: {result}")
+                    else:
+                        st.error(f"Grid setup failed: {result.get('error', 'Unknown error')}")
                 except Exception as e:
                     st.error(f"Error: {str(e)}")
                     logger.log("ERROR", f"Grid setup failed: {str(e)}")
+            
+            # Levels of the last grid set up, kept across reruns
+            if 'grid_result' in st.session_state:
+                grid_result, grid_lower, grid_upper = st.session_state.grid_result
+                df_grid = _records_df(grid_result['grid_id'], grid_result['grid_levels'])
+                st.dataframe(df_grid)
+                
+                # Visualization; plotly is only loaded once a grid has been set up
+                import plotly.graph_objects as go
+                fig = go.Figure()
+                
+                # Add grid lines as one trace, NaN-separated segments across the range
+                prices = df_grid['price'].to_numpy(dtype=float)
+                line_y = np.repeat(prices, 3)
+                line_y[2::3] = np.nan
+                fig.add_trace(go.Scatter(
+                    x=np.tile([0.0, 1.0, np.nan], len(prices)),
+                    y=line_y,
+                    mode='lines',
+                    line=dict(color='gray', dash='dot'),
+                    opacity=0.5,
+                    hoverinfo='skip',
+                    showlegend=False
+                ))
+                
+                # Add buy/sell markers
+                buy_levels = df_grid.loc[df_grid['side'] == 'BUY', 'price'].to_numpy()
+                sell_levels = df_grid.loc[df_grid['side'] == 'SELL', 'price'].to_numpy()
+                
+                fig.add_trace(go.Scatter(
+                    x=[0.5] * len(buy_levels),
+                    y=buy_levels,
+                    mode='markers',
+                    marker=dict(symbol='triangle-up', size=15, color='green'),
+                    name='Buy Levels'
+                ))
+                
+                fig.add_trace(go.Scatter(
+                    x=[0.5] * len(sell_levels),
+                    y=sell_levels,
+                    mode='markers',
+                    marker=dict(symbol='triangle-down', size=15, color='red'),
+                    name='Sell Levels'
+                ))
+                
+                # Price range shaded in the same layout update as the titles
+                fig.update_layout(
+                    title="Grid Trading Levels",
+                    yaxis_title="Price",
+                    showlegend=True,
+                    height=400,
+                    shapes=[dict(
+                        type="rect",
+                        x0=0, x1=1,
+                        y0=grid_lower, y1=grid_upper,
+                        fillcolor="lightblue",
+                        opacity=0.2,
+                        line_width=0
+                    )]
+                )
+                
+                st.plotly_chart(fig, use_container_width=True)
         
         with col2:
-            st.markdown("""
-            ### ℹ️ About Grid Trading
-            
-            **Grid trading** places multiple buy/sell orders within a price range.
-            
-            **Strategy:**
-            - Buy low, sell high automatically
-            - Profits from volatility
-            - Continuous trading within range
-            
-            **How it works:**
-            1. Define price range
-            2. Place limit orders at grid levels
-            3. Automatically execute when prices hit levels
-            
-            **Best for:**
-            - Range-bound markets
-            - High volatility
-            - Automated profit-taking
-            """)
+            _price_metric(symbol)
+            st.markdown(_about('grid'))
             
             # Grid stats
             if 'grid_lines' in locals() and 'lower_price' in locals() and 'upper_price' in locals():